@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from typing import Any, Dict, Mapping, Optional
 
-import yaml
 from pydantic import BaseModel, ConfigDict, field_validator
 
+from .config import _load_yaml_cached
+
 
 class ChunkingSpec(BaseModel):
     """Chunking hints for date-ranged endpoints."""
@@ -64,8 +65,8 @@ class AdapterRegistry(BaseModel):
         Required keys per endpoint: method, path, bld, response.root_keys.
         Optional keys: response.order_by, date_params, chunking.{days,gap_days}.
         """
-        with open(config_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+        # Shared cached parse: ConfigFacade typically loads the same file
+        data = _load_yaml_cached(str(config_path))
 
         endpoints = data.get("endpoints")
         if not isinstance(endpoints, dict):
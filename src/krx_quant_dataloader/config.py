@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import copy
+import functools
 import os
 from pathlib import Path
 from typing import Any, Dict, List, Mapping, MutableMapping, Optional
@@ -8,6 +10,26 @@ import yaml
 from pydantic import BaseModel, ConfigDict, field_validator
 
 
+def _load_yaml_cached(path: str) -> Dict[str, Any]:
+    """Load a YAML file once per path and content version, sharing the dict.
+
+    ConfigFacade and AdapterRegistry both read the same config file during
+    setup; caching the parse halves that cost. The file's mtime is part of
+    the cache key, so an edited file is re-parsed on the next load instead
+    of being served stale. Callers must treat the returned dict as
+    read-only (deep-copy before mutating).
+    """
+    return _parse_yaml(path, os.stat(path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_yaml(path: str, mtime_ns: int) -> Dict[str, Any]:
+    # mtime_ns is a cache-key component only: a rewritten file gets a fresh
+    # entry and the bounded maxsize ages the superseded parse out
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
+
+
 class RetriesConfig(BaseModel):
     """Retry policy configuration."""
 
@@ -225,21 +247,22 @@ class ConfigFacade:
             if not settings_path.is_absolute():
                 settings_path = project_root / settings_path
         
-        with open(settings_path, 'r', encoding='utf-8') as f:
-            settings_data = yaml.safe_load(f) or {}
-        
+        settings_data = _load_yaml_cached(str(settings_path))
+
         if env_prefix:
+            # Deep-copy before mutating: the cached dict is shared
+            settings_data = copy.deepcopy(settings_data)
             _apply_env_overrides(settings_data, env_prefix=env_prefix, nested_delim="__")
         
         settings = SettingsConfig(**settings_data)
         
         # Load endpoints using path from settings
         endpoints_path = project_root / settings.config.endpoints_yaml
-        with open(endpoints_path, 'r', encoding='utf-8') as f:
-            endpoints_data = yaml.safe_load(f) or {}
-        
+        endpoints_data = _load_yaml_cached(str(endpoints_path))
+
         # Apply environment overrides to endpoints data too
         if env_prefix:
+            endpoints_data = copy.deepcopy(endpoints_data)
             _apply_env_overrides(endpoints_data, env_prefix=env_prefix, nested_delim="__")
         
         # Parse hosts and endpoints from endpoints.yaml
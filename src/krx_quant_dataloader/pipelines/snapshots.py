@@ -15,13 +15,47 @@ Interaction:
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Dict, Iterable, List
 
+import numpy as np
+import pyarrow as pa
+
 from ..transforms.preprocessing import preprocess_change_rates_rows
 from ..transforms.adjustment import compute_adj_factors_grouped
 from ..storage.protocols import SnapshotWriter
 
 
+def _fetch_and_preprocess_day(
+    raw_client,
+    *,
+    date: str,
+    market: str,
+    adjusted_flag: bool,
+    endpoint_id: str,
+    host_id: str,
+) -> List[Dict[str, Any]]:
+    """Fetch and preprocess one day of change-rate snapshots.
+
+    Shared by the sequential and thread-pooled ingestion paths so request
+    construction lives in exactly one place. Returns an empty list for
+    holidays/non-trading days.
+    """
+    rows = raw_client.call(
+        endpoint_id,
+        host_id=host_id,
+        params={
+            "strtDd": date,
+            "endDd": date,
+            "mktId": market,
+            "adjStkPrc": 2 if adjusted_flag else 1,
+        },
+    )
+    if not rows:
+        return []  # holiday/non-trading day
+    return preprocess_change_rates_rows(rows, trade_date=date)
+
+
 def ingest_change_rates_day(
     raw_client,
     *,
@@ -56,20 +90,16 @@ def ingest_change_rates_day(
     int
         Count of rows written (0 for holidays/empty responses).
     """
-    rows = raw_client.call(
-        endpoint_id,
+    preprocessed = _fetch_and_preprocess_day(
+        raw_client,
+        date=date,
+        market=market,
+        adjusted_flag=adjusted_flag,
+        endpoint_id=endpoint_id,
         host_id=host_id,
-        params={
-            "strtDd": date,
-            "endDd": date,
-            "mktId": market,
-            "adjStkPrc": 2 if adjusted_flag else 1,
-        },
     )
-    if not rows:
+    if not preprocessed:
         return 0  # holiday/non-trading day
-
-    preprocessed = preprocess_change_rates_rows(rows, trade_date=date)
     return writer.write_snapshot_rows(preprocessed)
 
 
@@ -82,12 +112,18 @@ def ingest_change_rates_range(
     writer: SnapshotWriter,
     endpoint_id: str = "stock.all_change_rates",
     host_id: str = "krx",
+    n_workers: int = 1,
 ) -> Dict[str, int]:
     """Ingest multiple days of change-rate snapshots; resume-safe.
 
     Each day is fetched, preprocessed, and persisted before proceeding to the next.
     Errors on a given day are logged and recorded; subsequent days continue.
 
+    With n_workers > 1, fetch + preprocess fan out over a bounded thread pool
+    (overlapping network latency; concurrency is still bounded by the
+    transport's rate limiter) while writes stay serialized in the calling
+    thread, preserving the per-day persistence order guarantees of the writer.
+
     Parameters
     ----------
     raw_client
@@ -104,6 +140,8 @@ def ingest_change_rates_range(
         Endpoint ID.
     host_id : str
         Host ID.
+    n_workers : int
+        Number of concurrent fetch workers (default 1 = sequential).
 
     Returns
     -------
@@ -111,21 +149,47 @@ def ingest_change_rates_range(
         Mapping of date → row count written (or -1 for errors).
     """
     counts: Dict[str, int] = {}
-    for d in dates:
-        try:
-            counts[d] = ingest_change_rates_day(
-                raw_client,
-                date=d,
-                market=market,
-                adjusted_flag=adjusted_flag,
-                writer=writer,
-                endpoint_id=endpoint_id,
-                host_id=host_id,
-            )
-        except Exception as e:
-            # Log error (structured logging can be added here)
-            print(f"Error ingesting {d}: {type(e).__name__}: {e}")
-            counts[d] = -1  # sentinel for error
+
+    if n_workers <= 1:
+        for d in dates:
+            try:
+                counts[d] = ingest_change_rates_day(
+                    raw_client,
+                    date=d,
+                    market=market,
+                    adjusted_flag=adjusted_flag,
+                    writer=writer,
+                    endpoint_id=endpoint_id,
+                    host_id=host_id,
+                )
+            except Exception as e:
+                # Log error (structured logging can be added here)
+                print(f"Error ingesting {d}: {type(e).__name__}: {e}")
+                counts[d] = -1  # sentinel for error
+        return counts
+
+    def _fetch_one(d: str) -> List[Dict[str, Any]]:
+        return _fetch_and_preprocess_day(
+            raw_client,
+            date=d,
+            market=market,
+            adjusted_flag=adjusted_flag,
+            endpoint_id=endpoint_id,
+            host_id=host_id,
+        )
+
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        futures = {executor.submit(_fetch_one, d): d for d in dates}
+        for future in as_completed(futures):
+            d = futures[future]
+            try:
+                preprocessed = future.result()
+                # Writes serialized here; writer need not be thread-safe
+                counts[d] = writer.write_snapshot_rows(preprocessed) if preprocessed else 0
+            except Exception as e:
+                print(f"Error ingesting {d}: {type(e).__name__}: {e}")
+                counts[d] = -1  # sentinel for error
+
     return counts
 
 
@@ -153,8 +217,86 @@ def compute_and_persist_adj_factors(
     return writer.write_factor_rows(factors)
 
 
+def compute_and_persist_adj_factors_table(
+    table: pa.Table,
+    writer: SnapshotWriter,
+) -> int:
+    """Compute adjustment factors from a snapshot Arrow table and persist.
+
+    Fused single-pass variant of compute_and_persist_adj_factors for callers
+    that already hold the snapshot history as an Arrow table (e.g., from a
+    dataset scan). One sort by (ISU_SRT_CD, TRD_DD) plus a vectorized
+    shift/divide replaces the per-row dict grouping and Decimal arithmetic:
+
+        adj_factor_t = BAS_PRC_t / last_valid_close_{<t}   (within each symbol)
+
+    Matching compute_adj_factors_per_symbol, the previous close carries the
+    last non-null TDD_CLSPRC forward across halted days (null closes); only
+    the first observation per symbol — or a symbol whose earlier closes are
+    all null — yields a null factor.
+
+    Parameters
+    ----------
+    table : pa.Table
+        Snapshot table with TRD_DD, ISU_SRT_CD, BAS_PRC, TDD_CLSPRC columns.
+    writer : SnapshotWriter
+        Writer instance for persisting factor rows.
+
+    Returns
+    -------
+    int
+        Count of factor rows written.
+    """
+    if table.num_rows == 0:
+        return 0
+
+    # LAG semantics: PARTITION BY ISU_SRT_CD ORDER BY TRD_DD via one sort
+    tbl = table.sort_by([('ISU_SRT_CD', 'ascending'), ('TRD_DD', 'ascending')])
+
+    symbols = np.asarray(tbl.column('ISU_SRT_CD'))
+    dates = np.asarray(tbl.column('TRD_DD'))
+    bas = tbl.column('BAS_PRC').to_numpy(zero_copy_only=False).astype(np.float64)
+    close = tbl.column('TDD_CLSPRC').to_numpy(zero_copy_only=False).astype(np.float64)
+
+    # Forward-fill the last non-null close (halts leave null closes that
+    # must not break the carry — see compute_adj_factors_per_symbol): a
+    # running max over row indices of valid closes gives, per row, the
+    # position of the newest valid close at or before it.
+    n = len(close)
+    valid_idx = np.where(~np.isnan(close), np.arange(n), -1)
+    np.maximum.accumulate(valid_idx, out=valid_idx)
+
+    # Strictly-previous carry, restricted to the same symbol (the running
+    # max crosses group boundaries; a carried index pointing into another
+    # symbol means this symbol has no earlier valid close)
+    prev_idx = np.roll(valid_idx, 1)
+    if n:
+        prev_idx[0] = -1
+    safe_idx = np.maximum(prev_idx, 0)
+    has_prev = (prev_idx >= 0) & (symbols[safe_idx] == symbols)
+    prev_close = np.where(has_prev, close[safe_idx], np.nan)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        factors = np.where(
+            has_prev & (prev_close != 0),
+            bas / prev_close,
+            np.nan,
+        )
+
+    rows = [
+        {
+            'TRD_DD': d,
+            'ISU_SRT_CD': s,
+            'adj_factor': f if f == f else None,  # NaN → null
+        }
+        for d, s, f in zip(dates.tolist(), symbols.tolist(), factors.tolist())
+    ]
+    return writer.write_factor_rows(rows)
+
+
 __all__ = [
     "ingest_change_rates_day",
     "ingest_change_rates_range",
     "compute_and_persist_adj_factors",
+    "compute_and_persist_adj_factors_table",
 ]
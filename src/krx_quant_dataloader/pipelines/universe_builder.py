@@ -18,16 +18,247 @@ Design:
 - Subset relationships: univ100 ⊂ univ200 ⊂ univ500 ⊂ univ1000
 - One stock can appear in multiple universes (if rank ≤ threshold for each)
 - Hive-partitioned by TRD_DD for efficient date-range queries
+- Vectorized: one (TRD_DD, ISU_SRT_CD) sort plus one searchsorted bucket
+  assignment per build — no per-tier filter passes over the input
 """
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Dict
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 from ..storage.protocols import SnapshotWriter
+from ..storage.schema import UNIVERSES_SCHEMA
+
+try:  # Optional: JIT-compiled flags kernel (falls back to pure NumPy)
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+try:  # Optional: streaming Polars path for very large rank tables
+    import polars as pl
+except ImportError:
+    pl = None
+
+
+# Recognized universe tier columns, in output order
+_TIER_NAMES = ['univ100', 'univ200', 'univ500', 'univ1000']
+
+# Bit position of each tier in the packed univ_mask representation
+TIER_INDEX = {name: k for k, name in enumerate(_TIER_NAMES)}
+
+# Input columns every builder entry point needs (one hash-set diff per call
+# instead of per-column scans of the DataFrame's Index)
+_REQUIRED_COLUMNS = frozenset(('TRD_DD', 'ISU_SRT_CD', 'liquidity_rank'))
+
+
+if njit is not None:
+    @njit(cache=True, nogil=True, parallel=True)
+    def _fill_flags(ranks, thresholds, out):  # pragma: no cover - requires numba
+        """Fill the (N, T) int8 flag matrix: out[i, t] = ranks[i] <= thresholds[t].
+
+        Tight integer loop compiled to native code; prange splits the row
+        axis across cores and cache=True persists the compiled artifact so
+        later runs skip compilation.
+        """
+        for i in prange(ranks.shape[0]):
+            r = ranks[i]
+            for t in range(thresholds.shape[0]):
+                out[i, t] = 1 if r <= thresholds[t] else 0
+else:
+    _fill_flags = None
+
+# Inputs below this row count rebuild faster than a cache round-trip;
+# memoization only kicks in above it
+_MEMOIZE_MIN_ROWS = 1000
+
+# Above this row count build_universes_and_persist streams date-by-date
+# instead of materializing the full multi-date output before writing
+_STREAM_MIN_ROWS = 1_000_000
+
+
+# Opt-in switch for the disk memoization below: unset (the default) means
+# no cache directory is ever created
+_CACHE_DIR_ENV = 'KRX_UNIVERSE_CACHE_DIR'
+
+
+def _disk_memoize(min_rows: int = _MEMOIZE_MIN_ROWS):
+    """Disk-backed memoization for pure (ranks_df, universe_tiers) functions.
+
+    Opt-in: caching only happens when the KRX_UNIVERSE_CACHE_DIR environment
+    variable names a cache directory; by default every call recomputes and
+    nothing is written to disk. When enabled, results are keyed on a content
+    hash of the input frame plus the tier definitions, so idempotent re-runs
+    over identical ranks become a single Parquet read instead of a recompute.
+    Small inputs (below min_rows) skip the cache entirely — hashing and file
+    I/O would cost more than the kernel itself. Cache entries are written
+    atomically (tmp file + rename) and unreadable entries fall back to a
+    recompute rather than raising.
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(ranks_df: pd.DataFrame, universe_tiers: Dict[str, int]):
+            cache_dir = os.environ.get(_CACHE_DIR_ENV)
+            if not cache_dir or len(ranks_df) < min_rows:
+                return func(ranks_df, universe_tiers)
+
+            # Content hash: per-row pandas hash (handles string columns
+            # without Python-object round-trips) plus the sorted tier items
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(
+                pd.util.hash_pandas_object(ranks_df, index=False).to_numpy().tobytes()
+            )
+            digest.update(repr(tuple(sorted(universe_tiers.items()))).encode())
+
+            cache_path = Path(cache_dir) / f"{func.__name__}-{digest.hexdigest()}.parquet"
+            if cache_path.exists():
+                try:
+                    return pd.read_parquet(cache_path)
+                except (OSError, pa.ArrowInvalid):
+                    pass  # truncated/corrupt entry: recompute and rewrite
+
+            result = func(ranks_df, universe_tiers)
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Atomic publish: never leave a partially written file under the
+            # final name for a concurrent reader (or a crashed run) to find
+            tmp_path = cache_path.with_suffix(f'.tmp-{os.getpid()}')
+            result.to_parquet(tmp_path, index=False, compression='zstd')
+            os.replace(tmp_path, cache_path)
+            return result
+
+        return wrapper
+
+    return decorate
+
+
+def _drop_null_ranks(ranks_df: pd.DataFrame) -> pd.DataFrame:
+    """Drop rows whose liquidity_rank is null (NaN / pd.NA).
+
+    A stock with no rank belongs to no universe, so null-ranked rows are
+    excluded before the kernel's integer cast — casting NaN would wrap it
+    into a garbage rank (and Arrow-backed nullable columns from
+    query_parquet_table refuse the cast outright with a TypeError).
+    """
+    mask = ranks_df['liquidity_rank'].notna().to_numpy()
+    if mask.all():
+        return ranks_df
+    return ranks_df.loc[mask]
+
+
+# Structured dtype for the universe kernel output (field order = column order;
+# liquidity_rank is int16 to match UNIVERSES_SCHEMA's right-sized rank column)
+_UNIVERSES_DTYPE = np.dtype(
+    [('TRD_DD', 'U8'), ('ISU_SRT_CD', 'U12')]
+    + [(name, 'i1') for name in _TIER_NAMES]
+    + [('liquidity_rank', 'i2')]
+)
+
+
+def _build_universes_arrays(
+    dates: np.ndarray,
+    symbols: np.ndarray,
+    ranks: np.ndarray,
+    universe_tiers: Dict[str, int],
+) -> np.ndarray:
+    """Compute universe membership as a NumPy structured array.
+
+    Kernel behind build_universes: one broadcast compare of the rank vector
+    against all tier thresholds, filled into a preallocated structured array.
+    No pandas objects are allocated here; callers that only need field access
+    (e.g., writers) can consume the array directly, and build_universes wraps
+    it in a DataFrame at the API boundary.
+
+    Parameters
+    ----------
+    dates : np.ndarray
+        TRD_DD values (YYYYMMDD strings), parallel to symbols/ranks.
+    symbols : np.ndarray
+        ISU_SRT_CD values.
+    ranks : np.ndarray
+        Integer liquidity ranks (1 = most liquid).
+    universe_tiers : Dict[str, int]
+        Universe definitions as {name: rank_threshold}.
+
+    Returns
+    -------
+    np.ndarray
+        Structured array with fields TRD_DD, ISU_SRT_CD, univ100..univ1000,
+        liquidity_rank, in input row order.
+    """
+    ranks = np.asarray(ranks, dtype=np.int32)
+    # The stored liquidity_rank column is int16 (UNIVERSES_SCHEMA): ranks top
+    # out at the symbol count (~3000 on KRX), far below 32767. Guard rather
+    # than wrap — a silently truncated rank would corrupt the table.
+    int16_max = np.iinfo(np.int16).max
+    if ranks.size and ranks.max() > int16_max:
+        raise ValueError(
+            f"liquidity_rank {ranks.max()} exceeds int16 range "
+            f"({int16_max}) of the universes schema"
+        )
+    # Compare in int16 when the thresholds also fit: halves memory bandwidth
+    # through the kernel and doubles the SIMD lane count of the compare
+    # loops. Oversized tier thresholds fall back to int32 compares; the
+    # stored column is int16 either way (ranks are guarded above).
+    if all(v <= int16_max for v in universe_tiers.values()):
+        compare_ranks = ranks.astype(np.int16)
+        threshold_dtype = np.int16
+    else:
+        compare_ranks = ranks
+        threshold_dtype = np.int32
+    thresholds = np.asarray(
+        [universe_tiers.get(name, -1) for name in _TIER_NAMES],
+        dtype=threshold_dtype,
+    )
+
+    if _fill_flags is not None:
+        # Numba path: one native-code pass over (N, T), parallel over rows
+        flags = np.empty((len(ranks), len(thresholds)), dtype=np.int8)
+        _fill_flags(compare_ranks, thresholds, flags)
+        arr = np.empty(len(ranks), dtype=_UNIVERSES_DTYPE)
+        arr['TRD_DD'] = dates
+        arr['ISU_SRT_CD'] = symbols
+        arr['liquidity_rank'] = ranks
+        for t, name in enumerate(_TIER_NAMES):
+            arr[name] = flags[:, t]
+        return arr
+
+    # One binary search per row instead of T scalar compares: with
+    # thresholds ascending, searchsorted gives the smallest qualifying tier
+    # and every larger tier also qualifies (subset property), so each flag
+    # column is a monotone unpacking of that index. Missing tiers carry
+    # threshold -1 and sort first; no rank reaches them → flag 0.
+    # (This is the transpose of slicing rank-sorted rows at per-tier
+    # searchsorted cutoffs: same O(N log T) comparisons, but it keeps the
+    # symbol-sorted row order so no second permutation is needed.)
+    order = np.argsort(thresholds, kind='stable')
+    sorted_pos = np.empty_like(order)
+    sorted_pos[order] = np.arange(len(order))
+    smallest_tier = np.searchsorted(thresholds[order], compare_ranks, side='left')
+
+    arr = np.empty(len(ranks), dtype=_UNIVERSES_DTYPE)
+    arr['TRD_DD'] = dates
+    arr['ISU_SRT_CD'] = symbols
+    arr['liquidity_rank'] = ranks
+    # Compare directly into each int8 field via a zero-copy bool view
+    # (bool_ and int8 share 1-byte 0/1 layout): no intermediate bool matrix
+    # and no bool→int8 astype copy
+    for t, name in enumerate(_TIER_NAMES):
+        np.less_equal(
+            smallest_tier, sorted_pos[t], out=arr[name].view(np.bool_)
+        )
+    return arr
 
 
+@_disk_memoize()
 def build_universes(
     ranks_df: pd.DataFrame,
     universe_tiers: Dict[str, int],
@@ -80,6 +311,8 @@ def build_universes(
     - Subset relationships explicit: univ100=1 implies univ200=1, univ500=1, univ1000=1
     - If fewer stocks exist than threshold, only available stocks get 1
     - Boolean columns enable efficient filtering: df[df['univ100'] == 1]
+    - No per-date grouping is needed: ranks are cross-sectional within each
+      date, so the flags come from one global vectorized pass over all rows
     
     Examples
     --------
@@ -97,46 +330,331 @@ def build_universes(
     (0, 1, 1)
     """
     # Validate required columns
-    required_columns = ['TRD_DD', 'ISU_SRT_CD', 'liquidity_rank']
-    missing = [col for col in required_columns if col not in ranks_df.columns]
+    missing = _REQUIRED_COLUMNS.difference(ranks_df.columns)
     if missing:
-        raise KeyError(f"Missing required columns: {missing}")
-    
-    # Handle empty inputs
-    if ranks_df.empty or not universe_tiers:
-        return pd.DataFrame(columns=[
-            'TRD_DD', 'ISU_SRT_CD', 
-            'univ100', 'univ200', 'univ500', 'univ1000',
-            'liquidity_rank'
-        ])
-    
-    # Start with base data
-    result = ranks_df[['TRD_DD', 'ISU_SRT_CD', 'liquidity_rank']].copy()
-    
-    # Add boolean columns for each universe tier
-    # Initialize all to 0
-    for tier_name in ['univ100', 'univ200', 'univ500', 'univ1000']:
-        result[tier_name] = 0
-    
-    # Set flags based on rank thresholds
-    for universe_name, rank_threshold in universe_tiers.items():
-        if universe_name in ['univ100', 'univ200', 'univ500', 'univ1000']:
-            result.loc[result['liquidity_rank'] <= rank_threshold, universe_name] = 1
-    
-    # Reorder columns for consistency
-    result = result[[
-        'TRD_DD', 'ISU_SRT_CD',
-        'univ100', 'univ200', 'univ500', 'univ1000',
-        'liquidity_rank'
-    ]]
-    
-    # Sort by date (ascending) and symbol (ascending) for efficient storage
-    result = result.sort_values(
-        ['TRD_DD', 'ISU_SRT_CD'],
-        ascending=[True, True]
-    ).reset_index(drop=True)
+        raise KeyError(f"Missing required columns: {sorted(missing)}")
+
+    # Null-ranked stocks belong to no universe (baseline semantics)
+    ranks_df = _drop_null_ranks(ranks_df)
+
+    # Handle empty inputs before any kernel/sort work: a zero-length record
+    # wrap of the output dtype gives correctly typed columns for free
+    if len(ranks_df) == 0 or not universe_tiers:
+        return pd.DataFrame.from_records(np.empty(0, dtype=_UNIVERSES_DTYPE))
     
-    return result
+    # All flag computation happens in the NumPy kernel (one broadcast over
+    # tiers, structured-array output); pandas only wraps the result at the
+    # API boundary. Tiers not in universe_tiers get threshold -1, which no
+    # rank satisfies → flag 0.
+    #
+    # Sort by date then symbol for efficient storage: both columns are
+    # low-cardinality strings repeated many times, so lexsort runs on their
+    # categorical int codes (categories are lexicographically ordered, so
+    # code order == string order) instead of comparing strings per element.
+    order = _sort_order(ranks_df)
+    arr = _build_universes_arrays(
+        ranks_df['TRD_DD'].to_numpy()[order],
+        ranks_df['ISU_SRT_CD'].to_numpy()[order],
+        ranks_df['liquidity_rank'].to_numpy(dtype=np.int32)[order],
+        universe_tiers,
+    )
+    return pd.DataFrame.from_records(arr)
+
+
+def build_universes_arrow(
+    ranks_df: pd.DataFrame,
+    universe_tiers: Dict[str, int],
+) -> pa.Table:
+    """
+    Construct universe membership as a PyArrow Table (columnar sibling).
+
+    Same semantics and row order as build_universes, but the kernel output
+    goes straight from NumPy buffers into Arrow arrays — no pandas DataFrame
+    wrap and no per-scalar boxing. Callers headed for Parquet (via
+    write_universes_table or write_universes_dataset) can skip the
+    pandas round-trip entirely.
+
+    Parameters
+    ----------
+    ranks_df : pd.DataFrame
+        Liquidity ranks DataFrame (see build_universes for schema).
+    universe_tiers : Dict[str, int]
+        Universe definitions as {name: rank_threshold}.
+
+    Returns
+    -------
+    pa.Table
+        Columns: TRD_DD, then the UNIVERSES_SCHEMA fields (ISU_SRT_CD, tier
+        flags, liquidity_rank). Sorted by TRD_DD, then ISU_SRT_CD.
+
+    Raises
+    ------
+    KeyError
+        If required columns are missing from ranks_df.
+    """
+    missing = _REQUIRED_COLUMNS.difference(ranks_df.columns)
+    if missing:
+        raise KeyError(f"Missing required columns: {sorted(missing)}")
+
+    ranks_df = _drop_null_ranks(ranks_df)
+
+    if len(ranks_df) == 0 or not universe_tiers:
+        return _ARROW_OUTPUT_SCHEMA.empty_table()
+
+    order = _sort_order(ranks_df)
+    arr = _build_universes_arrays(
+        ranks_df['TRD_DD'].to_numpy()[order],
+        ranks_df['ISU_SRT_CD'].to_numpy()[order],
+        ranks_df['liquidity_rank'].to_numpy(dtype=np.int32)[order],
+        universe_tiers,
+    )
+    return _arrow_table(arr)
+
+
+# build_universes_arrow output schema: the persisted UNIVERSES_SCHEMA plus a
+# leading TRD_DD column (stripped into the partition path at write time)
+_ARROW_OUTPUT_SCHEMA = pa.schema(
+    [pa.field('TRD_DD', pa.string())] + list(UNIVERSES_SCHEMA)
+)
+
+# Schema-metadata marker stamped on builder output tables: the kernel input
+# is already (TRD_DD, ISU_SRT_CD)-sorted, so writers that see this marker
+# can skip their own sort pass (see write_universes_table)
+SORTED_BY_METADATA = {b'sorted_by': b'TRD_DD,ISU_SRT_CD'}
+
+
+def build_universes_polars(
+    ranks_df,
+    universe_tiers: Dict[str, int],
+) -> pa.Table:
+    """
+    Polars-backed universe construction for very large rank tables.
+
+    Runs the tier flags through Polars' lazy engine: the flag expressions,
+    sort, and collection execute inside its streaming query optimizer, so
+    multi-year rank tables never materialize as one eager frame. Output
+    matches build_universes_arrow (same schema, same row order). When
+    polars is not installed, falls back to build_universes_arrow — the
+    dependency stays optional, like numba for the flags kernel.
+
+    Parameters
+    ----------
+    ranks_df : pd.DataFrame | pl.DataFrame | pl.LazyFrame
+        Liquidity ranks (see build_universes for required columns).
+    universe_tiers : Dict[str, int]
+        Universe definitions as {name: rank_threshold}.
+
+    Returns
+    -------
+    pa.Table
+        Same columns and sort order as build_universes_arrow.
+    """
+    if pl is None:
+        return build_universes_arrow(ranks_df, universe_tiers)
+
+    if isinstance(ranks_df, pd.DataFrame):
+        missing = _REQUIRED_COLUMNS.difference(ranks_df.columns)
+        if missing:
+            raise KeyError(f"Missing required columns: {sorted(missing)}")
+        ranks_df = _drop_null_ranks(ranks_df)
+        if len(ranks_df) == 0 or not universe_tiers:
+            return _ARROW_OUTPUT_SCHEMA.empty_table()
+        lf = pl.from_pandas(
+            ranks_df[['TRD_DD', 'ISU_SRT_CD', 'liquidity_rank']]
+        ).lazy()
+    elif isinstance(ranks_df, pl.DataFrame):
+        lf = ranks_df.lazy()
+    else:
+        lf = ranks_df
+
+    if not universe_tiers:
+        return _ARROW_OUTPUT_SCHEMA.empty_table()
+
+    # Same semantics as the NumPy kernel: tiers absent from universe_tiers
+    # get threshold -1, which no rank satisfies; null ranks belong to no
+    # universe and are dropped (pandas inputs were filtered above)
+    lf = lf.filter(pl.col('liquidity_rank').is_not_null())
+    flag_exprs = [
+        (pl.col('liquidity_rank') <= universe_tiers.get(name, -1))
+        .cast(pl.Int8)
+        .alias(name)
+        for name in _TIER_NAMES
+    ]
+    out = (
+        lf.select(['TRD_DD', 'ISU_SRT_CD', 'liquidity_rank'])
+        .with_columns(flag_exprs)
+        .select(['TRD_DD', 'ISU_SRT_CD', *_TIER_NAMES, 'liquidity_rank'])
+        .sort(['TRD_DD', 'ISU_SRT_CD'])
+        .collect(engine='streaming')
+    )
+    return out.to_arrow().cast(_ARROW_OUTPUT_SCHEMA)
+
+
+def _arrow_table(arr: np.ndarray) -> pa.Table:
+    """Wrap a universe kernel structured array in an Arrow table (zero boxing)."""
+    return pa.Table.from_pydict(
+        {
+            name: pa.array(arr[name], type=_ARROW_OUTPUT_SCHEMA.field(name).type)
+            for name in _ARROW_OUTPUT_SCHEMA.names
+        },
+        schema=_ARROW_OUTPUT_SCHEMA,
+    ).replace_schema_metadata(SORTED_BY_METADATA)
+
+
+def _arrow_data_table(arr: np.ndarray) -> pa.Table:
+    """Arrow table of the persisted columns only (no TRD_DD column).
+
+    For single-date writes the date lives in the partition directory, so
+    materializing a column that repeats one 8-char string N times — only
+    for the writer to drop it — is pure waste; skip building it at all.
+    """
+    return pa.Table.from_pydict(
+        {
+            name: pa.array(arr[name], type=UNIVERSES_SCHEMA.field(name).type)
+            for name in UNIVERSES_SCHEMA.names
+        },
+        schema=UNIVERSES_SCHEMA,
+    ).replace_schema_metadata(SORTED_BY_METADATA)
+
+
+# Sort permutations memoized per input frame: parameter sweeps rebuild
+# universes over the same ranks_df with different tier sets, and the
+# (TRD_DD, ISU_SRT_CD) sort is identical across those calls. Keyed on the
+# frame's identity and validated against a content fingerprint of the sort
+# key columns, so in-place mutation of the frame invalidates the entry
+# instead of serving a stale permutation; a weakref finalizer evicts the
+# entry when the frame is garbage-collected, so a recycled id() can never
+# collide. Entries hold (fingerprint, permutation).
+_SORT_ORDER_CACHE: Dict[int, tuple] = {}
+
+
+def clear_sort_order_cache() -> None:
+    """Drop memoized sort permutations (rarely needed; entries self-validate)."""
+    _SORT_ORDER_CACHE.clear()
+
+
+def _sort_key_fingerprint(ranks_df: pd.DataFrame) -> bytes:
+    """Content hash of the (TRD_DD, ISU_SRT_CD) sort key columns."""
+    digest = hashlib.blake2b(digest_size=16)
+    for column in ('TRD_DD', 'ISU_SRT_CD'):
+        digest.update(
+            pd.util.hash_pandas_object(ranks_df[column], index=False)
+            .to_numpy()
+            .tobytes()
+        )
+    return digest.digest()
+
+
+def _sort_order(ranks_df: pd.DataFrame) -> np.ndarray:
+    """Row permutation sorting ranks_df by (TRD_DD, ISU_SRT_CD).
+
+    Lexsort runs on categorical integer codes rather than the string values:
+    pd.Categorical's categories are lexicographically sorted, so comparing
+    codes is equivalent to comparing strings at a fraction of the cost.
+    Results are memoized per frame and revalidated against a content hash of
+    the key columns on every reuse — an O(N) hash pass against the O(N log N)
+    sort it saves — so mutating a frame in place triggers a fresh sort rather
+    than a silently stale row order.
+    """
+    key = id(ranks_df)
+    fingerprint = _sort_key_fingerprint(ranks_df)
+    entry = _SORT_ORDER_CACHE.get(key)
+    if entry is not None and entry[0] == fingerprint:
+        return entry[1]
+
+    date_codes = pd.Categorical(ranks_df['TRD_DD']).codes
+    symbol_codes = pd.Categorical(ranks_df['ISU_SRT_CD']).codes
+    order = np.lexsort((symbol_codes, date_codes))
+
+    if entry is None:
+        weakref.finalize(ranks_df, _SORT_ORDER_CACHE.pop, key, None)
+    _SORT_ORDER_CACHE[key] = (fingerprint, order)
+    return order
+
+
+def build_universe_mask(
+    ranks_df: pd.DataFrame,
+    universe_tiers: Dict[str, int],
+) -> pd.DataFrame:
+    """
+    Construct universe membership with tier flags packed into one uint16.
+
+    Compact alternative to build_universes: instead of one int8 column per
+    tier, bit k of 'univ_mask' records membership in tier k (see TIER_INDEX).
+    Shrinks the per-row footprint from T bytes to 2 and turns multi-tier
+    filters into single bitwise ops; use in_tier() to unpack a tier.
+
+    Parameters
+    ----------
+    ranks_df : pd.DataFrame
+        Liquidity ranks DataFrame (see build_universes for schema).
+    universe_tiers : Dict[str, int]
+        Universe definitions as {name: rank_threshold}.
+
+    Returns
+    -------
+    pd.DataFrame
+        Columns: TRD_DD, ISU_SRT_CD, univ_mask (uint16), liquidity_rank.
+        Sorted by TRD_DD, then ISU_SRT_CD (same order as build_universes).
+
+    Examples
+    --------
+    >>> masked = build_universe_mask(ranks, {'univ100': 100, 'univ200': 200})
+    >>> in_tier(masked, 'univ100')
+    array([ True, False, ...])
+    """
+    missing = _REQUIRED_COLUMNS.difference(ranks_df.columns)
+    if missing:
+        raise KeyError(f"Missing required columns: {sorted(missing)}")
+
+    ranks_df = _drop_null_ranks(ranks_df)
+
+    if len(ranks_df) == 0 or not universe_tiers:
+        return pd.DataFrame({
+            'TRD_DD': np.empty(0, dtype='U8'),
+            'ISU_SRT_CD': np.empty(0, dtype='U12'),
+            'univ_mask': np.empty(0, dtype=np.uint16),
+            'liquidity_rank': np.empty(0, dtype=np.int16),
+        })
+
+    order = _sort_order(ranks_df)
+    arr = _build_universes_arrays(
+        ranks_df['TRD_DD'].to_numpy()[order],
+        ranks_df['ISU_SRT_CD'].to_numpy()[order],
+        ranks_df['liquidity_rank'].to_numpy(dtype=np.int32)[order],
+        universe_tiers,
+    )
+
+    # Pack the int8 tier flags into bit positions of one uint16 word
+    mask = np.zeros(len(arr), dtype=np.uint16)
+    for name, k in TIER_INDEX.items():
+        mask |= arr[name].astype(np.uint16) << k
+
+    return pd.DataFrame({
+        'TRD_DD': arr['TRD_DD'],
+        'ISU_SRT_CD': arr['ISU_SRT_CD'],
+        'univ_mask': mask,
+        'liquidity_rank': arr['liquidity_rank'],
+    })
+
+
+def in_tier(universes_df: pd.DataFrame, tier_name: str) -> np.ndarray:
+    """Unpack one tier's membership from a packed univ_mask frame.
+
+    Parameters
+    ----------
+    universes_df : pd.DataFrame
+        Output of build_universe_mask (must have a 'univ_mask' column).
+    tier_name : str
+        Tier to test, e.g. 'univ100'.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean membership vector, parallel to universes_df rows.
+    """
+    k = TIER_INDEX[tier_name]
+    return ((universes_df['univ_mask'].to_numpy() >> k) & 1).astype(bool)
 
 
 def build_universes_and_persist(
@@ -169,7 +687,13 @@ def build_universes_and_persist(
     -----
     - Writes are idempotent: re-running with same data overwrites partitions
     - Data is partitioned by TRD_DD (one partition per date)
+    - Multi-date batches go through one ds.write_dataset call: a single
+      traversal splits the partitions in Arrow C++, so file open/close and
+      footer overhead stays O(1) in the number of dates
     - Per-date writes enable resume-safe operation
+    - Large inputs stream date-by-date through the kernel and writer, so
+      peak memory is bounded by the largest single date rather than the
+      whole date range
     
     Examples
     --------
@@ -180,32 +704,102 @@ def build_universes_and_persist(
     >>> count = build_universes_and_persist(ranks, tiers, writer)
     >>> print(f"Persisted {count} universe membership rows")
     """
+    missing = _REQUIRED_COLUMNS.difference(ranks_df.columns)
+    if missing:
+        raise KeyError(f"Missing required columns: {sorted(missing)}")
+
+    ranks_df = _drop_null_ranks(ranks_df)
+
+    if len(ranks_df) == 0 or not universe_tiers:
+        return 0
+
+    # Streaming path for large inputs: fuse the per-date build and write so
+    # only one date's output table is ever resident — peak memory is
+    # O(largest date x tiers) instead of O(total rows x tiers). Below the
+    # threshold the whole-frame batch write is cheaper (one dataset call).
+    write_table = getattr(writer, 'write_universes_table', None)
+    if write_table is not None and len(ranks_df) >= _STREAM_MIN_ROWS:
+        order = _sort_order(ranks_df)
+        all_dates = ranks_df['TRD_DD'].to_numpy()[order]
+        all_symbols = ranks_df['ISU_SRT_CD'].to_numpy()[order]
+        all_ranks = ranks_df['liquidity_rank'].to_numpy(dtype=np.int32)[order]
+
+        dates, starts = np.unique(all_dates, return_index=True)
+        ends = np.r_[starts[1:], len(all_dates)]
+
+        def _build_and_write(job: tuple) -> int:
+            date, start, end = job
+            arr = _build_universes_arrays(
+                all_dates[start:end],
+                all_symbols[start:end],
+                all_ranks[start:end],
+                universe_tiers,
+            )
+            return write_table(_arrow_data_table(arr), date=date)
+
+        # Dates are independent (cross-sectional ranks) and each one writes
+        # its own partition file, so per-date jobs can run concurrently; the
+        # NumPy kernel and Parquet write release the GIL, and in-flight
+        # tables stay bounded by the worker count
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            return sum(
+                pool.map(
+                    _build_and_write,
+                    zip(dates.tolist(), starts.tolist(), ends.tolist()),
+                )
+            )
+
     # Build universe membership
     universes_df = build_universes(ranks_df, universe_tiers)
-    
+
     if universes_df.empty:
         return 0
-    
-    # Persist per date (Hive partitioning)
+
+    # Preferred path: hand every date to the writer in one dataset call and
+    # let Arrow split the partitions (no Python per-date loop at all)
+    write_dataset = getattr(writer, 'write_universes_dataset', None)
+    if write_dataset is not None:
+        return write_dataset(
+            {name: universes_df[name].to_numpy() for name in universes_df.columns}
+        )
+
+    # Persist per date (Hive partitioning). The output is already sorted by
+    # TRD_DD, so one np.unique scan yields each date's contiguous [start, end)
+    # slice — no hash-based groupby and no per-date boolean mask over all rows.
     total_written = 0
-    
-    for date in sorted(universes_df['TRD_DD'].unique()):
-        # Get rows for this date
-        date_rows = universes_df[universes_df['TRD_DD'] == date]
-        
-        # Convert to list of dicts for writer
-        rows = date_rows.to_dict('records')
-        
-        # Write to database
-        writer.write_universes(rows, date=date)
-        
-        total_written += len(rows)
-    
+
+    date_values = universes_df['TRD_DD'].to_numpy()
+    dates, starts = np.unique(date_values, return_index=True)
+    ends = np.r_[starts[1:], len(universes_df)]
+
+    # Prefer the columnar writer path (Arrow table straight from buffers);
+    # fall back to row dicts for writers that only implement write_universes
+    write_arrays = getattr(writer, 'write_universes_arrays', None)
+    data_columns = [c for c in universes_df.columns if c != 'TRD_DD']
+
+    for date, start, end in zip(dates.tolist(), starts.tolist(), ends.tolist()):
+        if write_arrays is not None:
+            columns = {
+                name: universes_df[name].to_numpy()[start:end]
+                for name in data_columns
+            }
+            total_written += write_arrays(columns, date=date)
+        else:
+            rows = universes_df.iloc[start:end].to_dict('records')
+            writer.write_universes(rows, date=date)
+            total_written += end - start
+
     return total_written
 
 
 __all__ = [
     'build_universes',
+    'build_universes_arrow',
+    'build_universes_polars',
+    'build_universe_mask',
     'build_universes_and_persist',
+    'in_tier',
+    'clear_sort_order_cache',
+    'TIER_INDEX',
 ]
 
@@ -15,13 +15,15 @@ Interaction:
 
 from __future__ import annotations
 
+import bisect
+import functools
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 import pyarrow as pa
-import pyarrow.parquet as pq
 import pyarrow.compute as pc
+import pyarrow.dataset as ds
 
 
 # Universe name to rank threshold mapping
@@ -42,7 +44,9 @@ def query_parquet_table(
     end_date: str,
     symbols: Optional[List[str]] = None,
     fields: Optional[List[str]] = None,
-) -> pd.DataFrame:
+    return_arrow: bool = False,
+    arrow_backed: bool = False,
+) -> pd.DataFrame | pa.Table:
     """
     Generic Parquet table query with Hive partition optimization.
     
@@ -68,12 +72,21 @@ def query_parquet_table(
         Column names to retrieve (column pruning).
         If None, returns all columns.
         Note: TRD_DD is always included (injected from partition names).
-    
+    return_arrow : bool
+        If True, return the PyArrow Table directly and skip the pandas
+        conversion entirely (no BlockManager copy). Default False.
+    arrow_backed : bool
+        If True, return a DataFrame with pd.ArrowDtype extension columns
+        (zero-copy from the Arrow buffers, dictionary-encoded TRD_DD).
+        Opt-in: the dtypes differ from the default numpy-backed frame
+        (e.g., nullable integers instead of float64-with-NaN), so existing
+        consumers keep the numpy contract unless they ask. Default False.
+
     Returns
     -------
-    pd.DataFrame
-        Query results with TRD_DD as column.
-        Empty DataFrame if no data found (holidays, missing date range).
+    pd.DataFrame | pa.Table
+        Query results with TRD_DD as column (pa.Table if return_arrow=True).
+        Empty DataFrame/Table if no data found (holidays, missing date range).
     
     Optimizations Applied
     ---------------------
@@ -113,33 +126,63 @@ def query_parquet_table(
     
     if not partition_names:
         # No partitions found (all holidays or missing data)
-        # Return empty DataFrame with expected columns
+        # Return empty DataFrame/Table with expected columns
+        if return_arrow:
+            schema = pa.schema([(col, pa.string()) for col in (fields or [])])
+            return pa.table({col: [] for col in (fields or [])}, schema=schema)
         if fields:
             return pd.DataFrame(columns=fields)
         else:
             return pd.DataFrame()
     
-    # Build symbol filter if provided
-    filters = None
+    # Build combined pushdown filter: partition pruning on TRD_DD plus
+    # row-group stat pruning on ISU_SRT_CD (leverages sorted writes)
+    filter_expr = (pc.field('TRD_DD') >= start_date) & (pc.field('TRD_DD') <= end_date)
     if symbols:
-        filters = _build_symbol_filter(symbols)
-    
-    # Read partitions with PyArrow (zero-copy, optimized)
-    table = _read_partitions_pyarrow(
+        filter_expr = filter_expr & _build_symbol_filter(symbols)
+
+    # Scan with PyArrow dataset (partition + row-group pruning in one planner pass)
+    table = _scan_dataset(
         table_path=table_path,
-        partition_names=partition_names,
         columns=fields,
-        filters=filters,
+        filter_expr=filter_expr,
     )
     
-    # Convert to Pandas DataFrame
-    df = table.to_pandas()
-    
-    # Ensure TRD_DD is string type (consistent with partition names)
-    if 'TRD_DD' in df.columns:
-        df['TRD_DD'] = df['TRD_DD'].astype(str)
-    
-    return df
+    if return_arrow:
+        return table
+
+    if arrow_backed:
+        # Dictionary-encode TRD_DD before conversion: the column holds one
+        # distinct value per partition, so int32 indices + a tiny dictionary
+        # replace N copies of the date string (and later group-by/equality
+        # compares indices instead of strings)
+        trd_dd_idx = table.schema.get_field_index('TRD_DD')
+        if trd_dd_idx >= 0 and pa.types.is_string(table.schema.field(trd_dd_idx).type):
+            encoded = pc.dictionary_encode(table.column(trd_dd_idx))
+            table = table.set_column(
+                trd_dd_idx, pa.field('TRD_DD', encoded.type), encoded
+            )
+
+        # Zero-copy conversion:
+        # - types_mapper=pd.ArrowDtype: Arrow-backed extension arrays, so
+        #   column buffers are shared with the Arrow table instead of copied
+        # - split_blocks: one block per column, avoids consolidation copies
+        # - self_destruct: release Arrow buffers as columns are handed off
+        # - use_threads: parallel column conversion
+        return table.to_pandas(
+            split_blocks=True,
+            self_destruct=True,
+            use_threads=True,
+            types_mapper=pd.ArrowDtype,
+        )
+
+    # Default: numpy-backed DataFrame, the dtype contract every existing
+    # consumer (DataLoader, orchestrator, liquidity_ranking) was built on
+    return table.to_pandas(
+        split_blocks=True,
+        self_destruct=True,
+        use_threads=True,
+    )
 
 
 def load_universe_symbols(
@@ -265,153 +308,120 @@ def _discover_partitions(
     → 01/04 missing (holidays) → silently skip
     """
     if not table_path.exists():
+        # Don't cache a missing table; it may be created by a later write
         return []
-    
-    # Find all TRD_DD=* directories (single-level partitioning)
-    all_partitions = [d.name for d in table_path.iterdir() if d.is_dir() and d.name.startswith('TRD_DD=')]
-    
-    # Filter by date range
-    filtered_partitions = []
-    for partition_name in all_partitions:
-        # Extract date from "TRD_DD=20240101"
-        date_str = partition_name.split('=')[1]
-        
-        # Check if in range
-        if start_date <= date_str <= end_date:
-            filtered_partitions.append(partition_name)
-    
-    # Sort by date
-    filtered_partitions.sort()
-    
-    return filtered_partitions
+
+    # The directory mtime is part of the cache key: creating (or removing) a
+    # partition subdirectory bumps it, so ingestion in the same process —
+    # through any writer — invalidates the listing without explicit hooks
+    all_partitions = _sorted_partition_names(
+        str(table_path), table_path.stat().st_mtime_ns
+    )
+
+    # Partition names are fixed-width ('TRD_DD=YYYYMMDD'), so lexicographic
+    # order equals date order and the range can be sliced with binary search
+    # instead of a linear scan over every partition directory.
+    lo = bisect.bisect_left(all_partitions, f'TRD_DD={start_date}')
+    hi = bisect.bisect_right(all_partitions, f'TRD_DD={end_date}~')  # '~' sorts after digits
+
+    return list(all_partitions[lo:hi])
+
+
+@functools.lru_cache(maxsize=256)
+def _sorted_partition_names(table_path: str, mtime_ns: int) -> Tuple[str, ...]:
+    """
+    List and sort TRD_DD=* partition directories for a table (cached).
+
+    The directory listing is cached per (table path, directory mtime) so
+    repeated queries plan in O(log N) via bisect instead of re-walking the
+    filesystem, while any write that adds a partition (which bumps the
+    directory mtime) naturally misses the stale entry. The bounded maxsize
+    lets superseded (path, mtime) entries age out.
+
+    Parameters
+    ----------
+    table_path : str
+        Path to table directory (string for hashability).
+    mtime_ns : int
+        The directory's st_mtime_ns at lookup time (cache-key component).
+
+    Returns
+    -------
+    Tuple[str, ...]
+        Sorted partition names (e.g., ('TRD_DD=20240101', ...)).
+    """
+    path = Path(table_path)
+    if not path.exists():
+        return ()
+
+    return tuple(sorted(
+        d.name for d in path.iterdir()
+        if d.is_dir() and d.name.startswith('TRD_DD=')
+    ))
+
+
+def clear_partition_cache() -> None:
+    """
+    Invalidate the cached partition listings.
+
+    Rarely needed: the cache keys on the table directory's mtime, so new
+    partitions are picked up automatically. Kept for edge cases where the
+    filesystem's mtime granularity is too coarse to observe a change.
+    """
+    _sorted_partition_names.cache_clear()
 
 
-def _read_partitions_pyarrow(
+# Hive partitioning spec shared by all tables (single-level TRD_DD partitioning).
+# Declared explicitly so partition values parse as strings, not inferred ints.
+_HIVE_PARTITIONING = ds.partitioning(
+    pa.schema([('TRD_DD', pa.string())]),
+    flavor='hive',
+)
+
+
+def _scan_dataset(
     table_path: Path,
-    partition_names: List[str],
     *,
     columns: Optional[List[str]] = None,
-    filters: Optional[pc.Expression] = None,
+    filter_expr: Optional[pc.Expression] = None,
 ) -> pa.Table:
     """
-    Read multiple Hive partitions with PyArrow (internal, zero-copy).
-    
+    Scan a Hive-partitioned table with PyArrow dataset (internal, zero-copy).
+
+    One planner pass handles partition pruning (TRD_DD directory names),
+    row-group pruning (min/max statistics vs. the filter), and column pruning.
+    TRD_DD is injected from the partition path when requested.
+
     Parameters
     ----------
     table_path : Path
         Path to table directory (e.g., db/snapshots/).
-    partition_names : List[str]
-        Partition names to read (e.g., ['TRD_DD=20240101', 'TRD_DD=20240102']).
     columns : Optional[List[str]]
-        Columns to read (column pruning).
-        If columns includes 'TRD_DD', it will be injected from partition names (not read from data).
-    filters : Optional[pc.Expression]
-        Row filters (e.g., ISU_SRT_CD.isin(['005930', '000660'])).
-    
+        Columns to read (column pruning). 'TRD_DD' resolves to the partition
+        field. If None, all columns plus TRD_DD are returned.
+    filter_expr : Optional[pc.Expression]
+        Pushdown filter (TRD_DD range, ISU_SRT_CD.isin, ...).
+
     Returns
     -------
     pa.Table
-        Concatenated table from all partitions with TRD_DD injected.
-    
+        Scan result with TRD_DD injected from partition names.
+
     Note: Internal function, not exposed to users. Returns PyArrow for speed.
     """
-    tables = []
-    
-    # Determine which columns to read from files (exclude TRD_DD if requested)
-    file_columns = columns
-    if columns and 'TRD_DD' in columns:
-        file_columns = [col for col in columns if col != 'TRD_DD']
-        if not file_columns:
-            file_columns = None  # Read all columns
-    
-    for partition_name in partition_names:
-        partition_path = table_path / partition_name / "data.parquet"
-        
-        if not partition_path.exists():
-            # Partition directory exists but no data file (should not happen in normal operation)
-            continue
-        
-        # Read partition with filters and column selection
-        table = pq.read_table(
-            partition_path,
-            columns=file_columns,
-            filters=filters,
-        )
-        
-        # Inject TRD_DD column from partition name
-        table = _inject_trd_dd_column(table, partition_name)
-        
-        tables.append(table)
-    
-    if not tables:
-        # No data found
-        if columns:
-            # Return empty table with requested schema
-            schema = pa.schema([(col, pa.string()) for col in columns])
-            return pa.table({col: [] for col in columns}, schema=schema)
-        else:
-            return pa.table({})
-    
-    # Concatenate all tables
-    combined_table = pa.concat_tables(tables)
-    
-    # If specific columns requested, select and reorder them
-    if columns:
-        # Ensure all requested columns exist
-        available_cols = combined_table.column_names
-        final_cols = [col for col in columns if col in available_cols]
-        combined_table = combined_table.select(final_cols)
-    
-    return combined_table
+    dataset = ds.dataset(
+        str(table_path),
+        format='parquet',
+        partitioning=_HIVE_PARTITIONING,
+    )
 
+    # Drop requested columns that don't exist in this table's schema
+    # (preserves lenient behavior of the previous per-partition reader)
+    if columns:
+        available = frozenset(dataset.schema.names)
+        columns = [col for col in columns if col in available]
 
-def _inject_trd_dd_column(
-    table: pa.Table,
-    partition_name: str,
-) -> pa.Table:
-    """
-    Inject TRD_DD column from partition name.
-    
-    Parameters
-    ----------
-    table : pa.Table
-        PyArrow table (may or may not have TRD_DD).
-    partition_name : str
-        Partition name (e.g., 'TRD_DD=20240101').
-    
-    Returns
-    -------
-    pa.Table
-        Table with TRD_DD column added (or replaced if already exists).
-    
-    Rationale
-    ---------
-    - TRD_DD is partition key (directory structure, not in data files)
-    - Must be injected for downstream processing (joins, sorting, grouping)
-    
-    Example
-    -------
-    Partition name: 'TRD_DD=20240101'
-    → Extracts '20240101' and adds as string column to table
-    """
-    # Extract date from "TRD_DD=20240101"
-    date_str = partition_name.split('=')[1]
-    
-    # Create TRD_DD column (string array with same length as table)
-    trd_dd_array = pa.array([date_str] * len(table), type=pa.string())
-    
-    # Remove TRD_DD if it already exists (avoid duplicates)
-    if 'TRD_DD' in table.column_names:
-        table = table.drop(['TRD_DD'])
-    
-    # Add column to table (prepend for consistency - first column)
-    # Use PyArrow Table constructor to specify column order
-    new_schema = pa.schema([('TRD_DD', pa.string())] + [(name, field.type) for name, field in zip(table.column_names, table.schema)])
-    new_columns = [trd_dd_array] + [table.column(name) for name in table.column_names]
-    
-    table = pa.table(dict(zip([field.name for field in new_schema], new_columns)), schema=new_schema)
-    
-    return table
+    return dataset.to_table(columns=columns or None, filter=filter_expr)
 
 
 def _build_symbol_filter(
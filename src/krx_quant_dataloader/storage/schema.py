@@ -110,7 +110,14 @@ UNIVERSES_SCHEMA = pa.schema([
     ('univ1000', pa.int8()),              # 1 if in top 1000, 0 otherwise
     
     # Reference field (for verification and debugging)
-    ('liquidity_rank', pa.int32()),       # Rank at time of universe construction (from pricevolume table)
+    # int16: ranks top out at the symbol count (~3000 on KRX), far below
+    # 32767 — half the bytes of int32 on disk and through every read. The
+    # builder kernel raises if a rank ever exceeds the int16 range.
+    # MIGRATION: universes partitions written before this change carry an
+    # int32 liquidity_rank; a single ds.dataset scan cannot unify int32 and
+    # int16 files, so rebuild old partitions (idempotent re-run of
+    # build_universes_and_persist over their date range) before mixing.
+    ('liquidity_rank', pa.int16()),       # Rank at time of universe construction (from pricevolume table)
 ])
 
 
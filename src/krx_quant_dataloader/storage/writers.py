@@ -19,7 +19,10 @@ import sqlite3
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 
 from .schema import (
@@ -31,6 +34,63 @@ from .schema import (
 )
 
 
+# Shared pq.write_table options for snapshot partitions:
+# - use_dictionary only on low-cardinality string columns (symbol/name/market
+#   codes); dictionary-encoding the int price columns would just add overhead
+# - sorting_columns records the ISU_SRT_CD sort invariant in file metadata so
+#   readers can trust it for min/max row-group pruning on symbol filters
+# - write_statistics makes the min/max stats backing that pruning explicit
+_SNAPSHOT_WRITE_OPTIONS: Dict[str, Any] = dict(
+    row_group_size=1000,  # ~1000 stocks per row group
+    compression='zstd',
+    compression_level=3,
+    use_dictionary=['ISU_SRT_CD', 'ISU_ABBRV', 'MKT_NM', 'MKT_ID', 'FLUC_TP'],
+    write_statistics=True,
+    sorting_columns=[
+        pq.SortingColumn(SNAPSHOTS_SCHEMA.get_field_index('ISU_SRT_CD')),
+    ],
+)
+
+
+# Shared pq.write_table options for universe partitions:
+# - use_dictionary: ISU_SRT_CD repeats a few thousand distinct symbols per
+#   partition, so dictionary encoding stores each code once plus small
+#   indices (the int8 flag and int16 rank columns gain nothing from it)
+# - write_statistics on the symbol/rank filter columns: data is symbol-
+#   sorted, so min/max stats give exact row-group pruning on symbol reads
+# - bloom filter on ISU_SRT_CD lets point lookups skip row groups without
+#   touching the data pages at all (ndv sized to the KRX symbol count)
+_UNIVERSE_WRITE_OPTIONS: Dict[str, Any] = dict(
+    row_group_size=500,  # Smaller row groups (universes are smaller datasets)
+    compression='zstd',
+    compression_level=3,
+    use_dictionary=['ISU_SRT_CD'],
+    write_statistics=['ISU_SRT_CD', 'liquidity_rank'],
+    bloom_filter_options={'ISU_SRT_CD': {'ndv': 4096, 'fpp': 0.05}},
+)
+
+
+def _ensure_partition_dir(table_path: str, date: str) -> Path:
+    """Create (if needed) and return a TRD_DD partition directory.
+
+    Also clears stale data-*.parquet files left by write_universes_dataset
+    (which names its output data-{i}.parquet): a per-date write replaces
+    the partition's full contents with a single data.parquet, and readers
+    scan the whole partition directory — a leftover dataset file would
+    double-count every row.
+
+    Deliberately not memoized: a rebuild-from-scratch flow may rmtree the
+    table between writes in the same process, and a cached Path that skips
+    the mkdir would then hand pq.write_table a missing directory. The
+    mkdir(exist_ok=True) is microseconds against a Parquet write.
+    """
+    partition_path = Path(table_path) / f"TRD_DD={date}"
+    partition_path.mkdir(parents=True, exist_ok=True)
+    for stale in partition_path.glob('data-*.parquet'):
+        stale.unlink()
+    return partition_path
+
+
 class CSVSnapshotWriter:
     """CSV-based snapshot and factor writer (UTF-8, no BOM, append-only)."""
 
@@ -250,6 +310,9 @@ class ParquetSnapshotWriter:
         self.factors_path = self.root_path / factors_table
         self.ranks_path = self.root_path / ranks_table
 
+        # Pending snapshot rows buffered by write_snapshot_batches(), keyed by date
+        self._pending: Dict[str, List[Dict[str, Any]]] = {}
+
         # NOTE: Directories are created lazily on first write to each table
         # This prevents creating obsolete directories (snapshots/, adj_factors/, liquidity_ranks/)
         # when ParquetSnapshotWriter is only used for universes/cumulative_adjustments
@@ -301,13 +364,127 @@ class ParquetSnapshotWriter:
         pq.write_table(
             table,
             partition_path / "data.parquet",
-            row_group_size=1000,  # ~1000 stocks per row group
-            compression='zstd',
-            compression_level=3,
+            **_SNAPSHOT_WRITE_OPTIONS,
         )
 
         return len(rows)
 
+    def write_snapshot_batch(self, batch: pa.RecordBatch, *, trd_dd: str) -> int:
+        """Write one day of snapshots from an Arrow RecordBatch (columnar path).
+
+        Columnar alternative to write_snapshot_rows for callers that already
+        hold typed Arrow arrays: skips the per-row dict materialization
+        entirely (N rows x ~15 dict entries of key hashing) and goes straight
+        from columns to the partition file.
+
+        Parameters
+        ----------
+        batch : pa.RecordBatch
+            Snapshot columns for a single trading day. A TRD_DD column, if
+            present, is dropped (the partition directory encodes the date).
+        trd_dd : str
+            Trading date (YYYYMMDD) identifying the target partition.
+
+        Returns
+        -------
+        int
+            Count of rows written.
+        """
+        if batch.num_rows == 0:
+            return 0
+
+        table = pa.Table.from_batches([batch])
+        if 'TRD_DD' in table.schema.names:
+            table = table.drop_columns(['TRD_DD'])
+
+        # Same sort invariant as the row path: ISU_SRT_CD for row-group pruning
+        table = table.sort_by([('ISU_SRT_CD', 'ascending')])
+        table = table.select(SNAPSHOTS_SCHEMA.names).cast(SNAPSHOTS_SCHEMA, safe=False)
+
+        partition_path = self.snapshots_path / f"TRD_DD={trd_dd}"
+        partition_path.mkdir(parents=True, exist_ok=True)
+
+        pq.write_table(
+            table,
+            partition_path / "data.parquet",
+            **_SNAPSHOT_WRITE_OPTIONS,
+        )
+
+        return table.num_rows
+
+    def write_snapshot_batches(self, batches) -> int:
+        """Buffer multiple days of snapshot rows for a single deferred write.
+
+        Unlike write_snapshot_rows (one Arrow conversion and file per call),
+        batches accumulate in memory and flush() materializes them with one
+        Arrow conversion across all days, amortizing per-day table construction.
+        Intended for bulk backfills; per-day writes remain the resume-safe default.
+
+        Parameters
+        ----------
+        batches : Iterable[Tuple[str, List[Dict[str, Any]]]]
+            Pairs of (trade_date, preprocessed rows) to buffer.
+
+        Returns
+        -------
+        int
+            Count of rows buffered (written on flush()/close()).
+        """
+        buffered = 0
+        for trade_date, rows in batches:
+            if not rows:
+                continue
+            self._pending.setdefault(trade_date, []).extend(rows)
+            buffered += len(rows)
+        return buffered
+
+    def flush(self) -> int:
+        """Materialize buffered snapshot batches to Hive-partitioned Parquet.
+
+        Builds a single Arrow table covering all pending days (one conversion
+        pass instead of one per day), then slices it per TRD_DD partition.
+
+        Returns
+        -------
+        int
+            Count of rows written.
+        """
+        if not self._pending:
+            return 0
+
+        # One combined conversion, sorted by (TRD_DD, ISU_SRT_CD)
+        dates = sorted(self._pending)
+        all_rows: List[Dict[str, Any]] = []
+        for trade_date in dates:
+            all_rows.extend(
+                sorted(self._pending[trade_date], key=lambda r: r.get('ISU_SRT_CD', ''))
+            )
+
+        try:
+            table = pa.Table.from_pylist(all_rows, schema=SNAPSHOTS_SCHEMA)
+        except Exception:
+            table = pa.Table.from_pylist(all_rows)
+            table = table.cast(SNAPSHOTS_SCHEMA, safe=False)
+
+        # Slice the combined table per partition (zero-copy) and write each file
+        total_written = 0
+        offset = 0
+        for trade_date in dates:
+            n = len(self._pending[trade_date])
+            partition_path = self.snapshots_path / f"TRD_DD={trade_date}"
+            partition_path.mkdir(parents=True, exist_ok=True)
+
+            pq.write_table(
+                table.slice(offset, n),
+                partition_path / "data.parquet",
+                **_SNAPSHOT_WRITE_OPTIONS,
+            )
+            offset += n
+            total_written += n
+
+        self._pending.clear()
+        return total_written
+
     def write_factor_rows(self, rows: List[Dict[str, Any]]) -> int:
         """Write adjustment factor rows to Hive-partitioned Parquet.
 
@@ -466,43 +643,217 @@ class ParquetSnapshotWriter:
         """
         if not rows:
             return 0
-        
-        # Validate all rows have the expected date
-        for row in rows:
-            if row.get('TRD_DD') != date:
-                raise ValueError(f"Row date {row.get('TRD_DD')} != expected {date}")
-        
-        # Sort by ISU_SRT_CD for row-group pruning
-        rows_sorted = sorted(rows, key=lambda r: r.get('ISU_SRT_CD', ''))
-        
-        # Strip TRD_DD from data (it's in the partition path)
-        rows_no_date = [{k: v for k, v in row.items() if k != 'TRD_DD'} for row in rows_sorted]
-        
-        # Convert to PyArrow table
-        try:
-            table = pa.Table.from_pylist(rows_no_date, schema=UNIVERSES_SCHEMA)
-        except Exception:
-            table = pa.Table.from_pylist(rows_no_date)
-            table = table.cast(UNIVERSES_SCHEMA, safe=False)
-        
-        # Write to universes subdirectory (parallel to snapshots, adj_factors, liquidity_ranks)
-        universes_path = self.root_path / 'universes'
-        universes_path.mkdir(parents=True, exist_ok=True)
-        
-        # Write to specific partition
-        partition_path = universes_path / f"TRD_DD={date}"
-        partition_path.mkdir(parents=True, exist_ok=True)
-        
+
+        # One Arrow conversion up front; validation and sorting then run on
+        # typed columns instead of Python row dicts. Columns are gathered
+        # with one list comprehension per field and handed to from_pydict —
+        # from_pylist would walk every row dict once per field instead.
+        columns = {'TRD_DD': [r.get('TRD_DD') for r in rows]}
+        for name in UNIVERSES_SCHEMA.names:
+            columns[name] = [r.get(name) for r in rows]
+        table = pa.Table.from_pydict(columns)
+
+        # Validate all rows have the expected date with one min_max
+        # reduction: every value equals `date` iff min == max == date. No
+        # boolean mask array is materialized; skip_nulls=False surfaces rows
+        # missing TRD_DD as a null min/max ("Row date None != expected").
+        # (cast covers the all-null column inferred when no row carries TRD_DD)
+        stats = pc.min_max(
+            table.column('TRD_DD').cast(pa.string()), skip_nulls=False
+        ).as_py()
+        if stats['min'] != date or stats['max'] != date:
+            bad = stats['min'] if stats['min'] != date else stats['max']
+            raise ValueError(f"Row date {bad} != expected {date}")
+
+        # Sort by ISU_SRT_CD for row-group pruning (Arrow typed sort, no
+        # Python key callable), then strip TRD_DD (it's in the partition path)
+        indices = pc.sort_indices(table, sort_keys=[('ISU_SRT_CD', 'ascending')])
+        table = table.take(indices)
+        table = table.select(UNIVERSES_SCHEMA.names).cast(UNIVERSES_SCHEMA, safe=False)
+
+        # Write to universes subdirectory (parallel to snapshots, adj_factors,
+        # liquidity_ranks)
+        partition_path = _ensure_partition_dir(str(self.root_path / 'universes'), date)
+
         pq.write_table(
             table,
             partition_path / "data.parquet",
-            row_group_size=500,  # Smaller row groups (universes are smaller datasets)
-            compression='zstd',
-            compression_level=3,
+            **_UNIVERSE_WRITE_OPTIONS,
         )
-        
+
         return len(rows)
 
+    def write_universes_arrays(self, columns: Dict[str, Any], *, date: str) -> int:
+        """Write one date's universe membership from column arrays (columnar path).
+
+        Columnar alternative to write_universes: builds the Arrow table with
+        Table.from_pydict straight from NumPy buffers, so no per-row dicts
+        are materialized and no per-scalar boxing happens.
+
+        Parameters
+        ----------
+        columns : Dict[str, Any]
+            Arrays for every UNIVERSES_SCHEMA field (ISU_SRT_CD, tier flags,
+            liquidity_rank), parallel by row. A TRD_DD entry, if present, is
+            ignored (the partition directory encodes the date).
+        date : str
+            Trade date (YYYYMMDD) identifying the target partition.
+
+        Returns
+        -------
+        int
+            Count of rows written.
+        """
+        symbols = np.asarray(columns['ISU_SRT_CD'])
+        if len(symbols) == 0:
+            return 0
+
+        # Sort by ISU_SRT_CD for row-group pruning (one argsort, applied to
+        # every column during Arrow conversion)
+        order = np.argsort(symbols, kind='stable')
+        table = pa.Table.from_pydict(
+            {
+                name: pa.array(
+                    np.asarray(columns[name])[order],
+                    type=UNIVERSES_SCHEMA.field(name).type,
+                )
+                for name in UNIVERSES_SCHEMA.names
+            },
+            schema=UNIVERSES_SCHEMA,
+        )
+
+        partition_path = _ensure_partition_dir(str(self.root_path / 'universes'), date)
+
+        pq.write_table(
+            table,
+            partition_path / "data.parquet",
+            **_UNIVERSE_WRITE_OPTIONS,
+        )
+
+        return table.num_rows
+
+    def write_universes_table(self, table: pa.Table, *, date: str) -> int:
+        """Write one date's universe membership from a prebuilt Arrow table.
+
+        Fast path for callers that already hold an Arrow table (e.g.
+        build_universes_arrow output): no row dicts, no per-scalar boxing —
+        the table goes straight to the partition file after the usual sort
+        and schema cast.
+
+        Parameters
+        ----------
+        table : pa.Table
+            Universe membership columns for a single trading day. A TRD_DD
+            column, if present, is dropped (the partition directory encodes
+            the date).
+        date : str
+            Trade date (YYYYMMDD) identifying the target partition.
+
+        Returns
+        -------
+        int
+            Count of rows written.
+        """
+        if table.num_rows == 0:
+            return 0
+
+        # Builder tables arrive stamped with a sorted_by marker (the kernel
+        # input is already date/symbol sorted); honoring it skips a whole
+        # N log N pass per write
+        metadata = table.schema.metadata or {}
+        pre_sorted = metadata.get(b'sorted_by') == b'TRD_DD,ISU_SRT_CD'
+
+        if 'TRD_DD' in table.schema.names:
+            table = table.drop_columns(['TRD_DD'])
+
+        # Same sort invariant as the other universe paths: symbol order for
+        # row-group pruning
+        if not pre_sorted:
+            table = table.sort_by([('ISU_SRT_CD', 'ascending')])
+        table = table.select(UNIVERSES_SCHEMA.names).cast(UNIVERSES_SCHEMA, safe=False)
+
+        partition_path = _ensure_partition_dir(str(self.root_path / 'universes'), date)
+
+        pq.write_table(
+            table,
+            partition_path / "data.parquet",
+            **_UNIVERSE_WRITE_OPTIONS,
+        )
+
+        return table.num_rows
+
+    def write_universes_dataset(self, columns: Dict[str, Any]) -> int:
+        """Write universe membership for all dates in one dataset call.
+
+        Batch alternative to per-date write_universes_arrays calls: one Arrow
+        table spanning every date is handed to ds.write_dataset, which splits
+        it into TRD_DD= partitions in Arrow C++ (single traversal, threaded
+        output) instead of a Python-level loop with one pq.write_table per
+        date.
+
+        Parameters
+        ----------
+        columns : Dict[str, Any]
+            Arrays for TRD_DD plus every UNIVERSES_SCHEMA field, parallel by
+            row. Rows may span multiple dates.
+
+        Returns
+        -------
+        int
+            Count of rows written.
+        """
+        dates = np.asarray(columns['TRD_DD'])
+        if len(dates) == 0:
+            return 0
+
+        # TRD_DD rides along as a regular column here; write_dataset strips
+        # it into the partition directories
+        full_schema = pa.schema(
+            [pa.field('TRD_DD', pa.string())] + list(UNIVERSES_SCHEMA)
+        )
+        table = pa.Table.from_pydict(
+            {
+                name: pa.array(
+                    np.asarray(columns[name]), type=full_schema.field(name).type
+                )
+                for name in full_schema.names
+            },
+            schema=full_schema,
+        )
+
+        # Same sort invariant as the per-date paths: symbol order within each
+        # partition for row-group pruning (date first so partitions stay
+        # contiguous)
+        table = table.sort_by(
+            [('TRD_DD', 'ascending'), ('ISU_SRT_CD', 'ascending')]
+        )
+
+        # delete_matching clears each rewritten partition first, so re-runs
+        # stay idempotent even over partitions previously written by the
+        # per-date paths (readers scan the whole partition directory and
+        # would otherwise double-count leftover files)
+        ds.write_dataset(
+            table,
+            base_dir=str(self.root_path / 'universes'),
+            partitioning=ds.partitioning(
+                pa.schema([('TRD_DD', pa.string())]), flavor='hive'
+            ),
+            format='parquet',
+            basename_template='data-{i}.parquet',
+            existing_data_behavior='delete_matching',
+            file_options=ds.ParquetFileFormat().make_write_options(
+                compression='zstd',
+                compression_level=3,
+                use_dictionary=['ISU_SRT_CD'],
+                # (the dataset write API has no bloom-filter knob; per-date
+                # pq.write_table paths carry it via _UNIVERSE_WRITE_OPTIONS)
+                write_statistics=['ISU_SRT_CD', 'liquidity_rank'],
+            ),
+            max_rows_per_group=500,
+        )
+
+        return table.num_rows
+
     def write_cumulative_adjustments(self, rows: List[Dict[str, Any]], *, date: str) -> int:
         """Write cumulative adjustment multipliers to EPHEMERAL temp cache.
         
@@ -563,8 +914,10 @@ class ParquetSnapshotWriter:
         return len(rows)
 
     def close(self) -> None:
-        """No-op for Parquet; files are closed after each write."""
-        pass
+        """Flush pending batches and invalidate cached partition listings."""
+        self.flush()
+        from .query import clear_partition_cache
+        clear_partition_cache()
 
 
 class TempSnapshotWriter:
@@ -48,7 +48,15 @@ class Transport:
             Pass _NoopRateLimiter() to disable rate limiting (testing only).
         """
         self._cfg = config
-        self._http = http_client or requests.Session()
+        if http_client is None:
+            # Pooled session: reuses TCP+TLS connections across calls instead
+            # of paying the handshake cost on every request
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            http_client = session
+        self._http = http_client
         
         # Create rate limiter from config if not provided
         if rate_limiter is None:
@@ -0,0 +1,99 @@
+"""
+Unit tests for snapshots pipelines (pipelines/snapshots.py)
+
+Synthetic-data tests for the post-hoc adjustment factor paths. The key
+invariant: the vectorized Arrow-table variant must agree row-for-row with
+the per-row Decimal implementation in transforms/adjustment.py, including
+the carry of the last non-null close across halted days.
+"""
+
+import pyarrow as pa
+import pytest
+
+from krx_quant_dataloader.pipelines.snapshots import (
+    compute_and_persist_adj_factors_table,
+)
+from krx_quant_dataloader.transforms.adjustment import compute_adj_factors_grouped
+
+
+class _CollectingWriter:
+    """Minimal writer double: records factor rows instead of persisting."""
+
+    def __init__(self):
+        self.factor_rows = []
+
+    def write_factor_rows(self, rows):
+        self.factor_rows.extend(rows)
+        return len(rows)
+
+
+# One symbol with a halted day (null close) straddled by a 2:1 split, plus a
+# second symbol to exercise the group boundary (no carry across symbols)
+_SNAPSHOT_ROWS = [
+    {'TRD_DD': '20240101', 'ISU_SRT_CD': 'A', 'BAS_PRC': 100, 'TDD_CLSPRC': 100},
+    {'TRD_DD': '20240102', 'ISU_SRT_CD': 'A', 'BAS_PRC': 100, 'TDD_CLSPRC': 110},
+    # Halted: no close. The next factor must divide by 110, not null.
+    {'TRD_DD': '20240103', 'ISU_SRT_CD': 'A', 'BAS_PRC': None, 'TDD_CLSPRC': None},
+    # 2:1 split after the halt: BAS_PRC 55 vs last valid close 110 → 0.5
+    {'TRD_DD': '20240104', 'ISU_SRT_CD': 'A', 'BAS_PRC': 55, 'TDD_CLSPRC': 56},
+    {'TRD_DD': '20240101', 'ISU_SRT_CD': 'B', 'BAS_PRC': 200, 'TDD_CLSPRC': 200},
+    {'TRD_DD': '20240102', 'ISU_SRT_CD': 'B', 'BAS_PRC': 200, 'TDD_CLSPRC': 210},
+]
+
+
+def _table_factors(rows):
+    """Run the Arrow-table variant and key results by (date, symbol)."""
+    table = pa.table({
+        'TRD_DD': [r['TRD_DD'] for r in rows],
+        'ISU_SRT_CD': [r['ISU_SRT_CD'] for r in rows],
+        'BAS_PRC': [r['BAS_PRC'] for r in rows],
+        'TDD_CLSPRC': [r['TDD_CLSPRC'] for r in rows],
+    })
+    writer = _CollectingWriter()
+    count = compute_and_persist_adj_factors_table(table, writer)
+    assert count == len(rows)
+    return {(r['TRD_DD'], r['ISU_SRT_CD']): r['adj_factor'] for r in writer.factor_rows}
+
+
+@pytest.mark.unit
+class TestAdjFactorsTableVariant:
+    """The vectorized table path must match the per-row Decimal path."""
+
+    def test_matches_grouped_implementation(self):
+        expected = compute_adj_factors_grouped(list(_SNAPSHOT_ROWS))
+        actual = _table_factors(_SNAPSHOT_ROWS)
+
+        assert len(actual) == len(expected)
+        for row in expected:
+            key = (row['TRD_DD'], row['ISU_SRT_CD'])
+            factor_str = row['ADJ_FACTOR']
+            if factor_str == '':
+                assert actual[key] is None, key
+            else:
+                assert actual[key] == pytest.approx(float(factor_str)), key
+
+    def test_halted_day_carries_last_valid_close(self):
+        """A corporate action right after a halt must not be dropped."""
+        actual = _table_factors(_SNAPSHOT_ROWS)
+
+        # Split factor computed against the pre-halt close (55 / 110)
+        assert actual[('20240104', 'A')] == pytest.approx(0.5)
+        # The halted day itself has no base price → null factor
+        assert actual[('20240103', 'A')] is None
+        # First observation per symbol has no previous close
+        assert actual[('20240101', 'A')] is None
+        assert actual[('20240101', 'B')] is None
+
+    def test_no_carry_across_symbols(self):
+        """A symbol's first factor must not use the previous symbol's close."""
+        rows = [
+            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'A', 'BAS_PRC': 100, 'TDD_CLSPRC': 100},
+            # B's first row: A's close 100 must not leak in as prev_close
+            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'B', 'BAS_PRC': 50, 'TDD_CLSPRC': None},
+            {'TRD_DD': '20240102', 'ISU_SRT_CD': 'B', 'BAS_PRC': 60, 'TDD_CLSPRC': 60},
+        ]
+        actual = _table_factors(rows)
+
+        assert actual[('20240101', 'B')] is None
+        # B still has no valid earlier close on the second day either
+        assert actual[('20240102', 'B')] is None
@@ -27,12 +27,17 @@ Run with: poetry run pytest -v -m live tests/test_storage_parquet_live_smoke.py
 
 from __future__ import annotations
 
+import functools
+import os
 import shutil
 import tempfile
 from pathlib import Path
-from datetime import datetime, timedelta
 
+import numpy as np
 import pytest
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 
 from krx_quant_dataloader.client import RawClient
@@ -43,20 +48,39 @@ from krx_quant_dataloader.transport import Transport
 from krx_quant_dataloader.storage.writers import ParquetSnapshotWriter
 from krx_quant_dataloader.pipelines.snapshots import (
     ingest_change_rates_range,
-    compute_and_persist_adj_factors,
+    compute_and_persist_adj_factors_table,
 )
 
 
+@functools.lru_cache(maxsize=None)
 def generate_date_range(start_date: str, end_date: str) -> list[str]:
-    """Generate list of dates in YYYYMMDD format between start and end."""
-    start = datetime.strptime(start_date, "%Y%m%d")
-    end = datetime.strptime(end_date, "%Y%m%d")
-    dates = []
-    current = start
-    while current <= end:
-        dates.append(current.strftime("%Y%m%d"))
-        current += timedelta(days=1)
-    return dates
+    """Generate list of dates in YYYYMMDD format between start and end.
+
+    Vectorized via numpy datetime64 arithmetic (one C-level arange instead of
+    a per-day datetime + strftime loop) and cached across tests.
+    """
+    start = np.datetime64(f"{start_date[:4]}-{start_date[4:6]}-{start_date[6:]}", "D")
+    end = np.datetime64(f"{end_date[:4]}-{end_date[4:6]}-{end_date[6:]}", "D")
+    days = np.arange(start, end + np.timedelta64(1, "D"))
+    return [d.replace("-", "") for d in np.datetime_as_string(days, unit="D")]
+
+
+def _parquet_db_size(root: Path) -> int:
+    """Total size of *.parquet files under root via an os.scandir walk.
+
+    scandir reuses the stat info returned by the directory read (one syscall
+    per entry vs. rglob's Path construction + separate stat per file).
+    """
+    total = 0
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.parquet'):
+                    total += entry.stat().st_size
+    return total
 
 
 @pytest.fixture
@@ -68,9 +92,13 @@ def temp_parquet_db():
     shutil.rmtree(tmpdir, ignore_errors=True)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def raw_client(test_config_path: str):
-    """Create RawClient for live API calls."""
+    """Create RawClient for live API calls (shared across the session).
+
+    Session scope avoids re-parsing config YAML and re-establishing the
+    pooled HTTP session (TCP+TLS) for every test.
+    """
     cfg = ConfigFacade.load(settings_path=test_config_path)
     registry = AdapterRegistry.load(config_path=test_config_path)
     transport = Transport(cfg)
@@ -161,20 +189,29 @@ def test_parquet_ingestion_short_period(temp_parquet_db, raw_client):
         print(f"  Columns: {table.num_columns}")
         print(f"  Schema: {table.schema.names[:5]}...")  # First 5 columns
         
-        # Verify core columns exist
-        assert 'ISU_SRT_CD' in table.schema.names, "ISU_SRT_CD column missing"
-        assert 'TDD_CLSPRC' in table.schema.names, "TDD_CLSPRC column missing"
-        assert 'ACC_TRDVAL' in table.schema.names, "ACC_TRDVAL column missing"
+        # Verify core columns exist (one frozenset instead of repeated
+        # linear scans of the schema name list)
+        schema_names = frozenset(table.schema.names)
+        assert 'ISU_SRT_CD' in schema_names, "ISU_SRT_CD column missing"
+        assert 'TDD_CLSPRC' in schema_names, "TDD_CLSPRC column missing"
+        assert 'ACC_TRDVAL' in schema_names, "ACC_TRDVAL column missing"
         
         # Verify data is sorted by ISU_SRT_CD (for row-group pruning)
-        symbols = table['ISU_SRT_CD'].to_pylist()
-        assert symbols == sorted(symbols), "Data not sorted by ISU_SRT_CD"
+        # Vectorized monotonicity check: pairwise compare in Arrow C++ instead
+        # of materializing a Python list and sorting it
+        col = table.column('ISU_SRT_CD').combine_chunks()
+        assert pc.all(
+            pc.less_equal(col.slice(0, len(col) - 1), col.slice(1))
+        ).as_py(), "Data not sorted by ISU_SRT_CD"
         print(f"  ✓ Data sorted by ISU_SRT_CD")
         
-        # Display sample data
+        # Display sample data: select + slice are O(1) on the Arrow table,
+        # so only the 3 displayed rows ever materialize into pandas
         print(f"\nSample data (first 3 rows):")
-        df = table.to_pandas()
-        print(df[['ISU_SRT_CD', 'ISU_ABBRV', 'TDD_CLSPRC', 'ACC_TRDVAL']].head(3))
+        sample = table.select(
+            ['ISU_SRT_CD', 'ISU_ABBRV', 'TDD_CLSPRC', 'ACC_TRDVAL']
+        ).slice(0, 3).to_pandas()
+        print(sample)
         
         # Check file size and compression
         file_size = sample_path.stat().st_size
@@ -186,24 +223,23 @@ def test_parquet_ingestion_short_period(temp_parquet_db, raw_client):
     print("Phase 2: Compute adjustment factors")
     print(f"{'='*60}")
     
-    # Read back all snapshots for factor computation
-    all_snapshots = []
-    for partition_name in partitions:
-        partition_path = snapshots_dir / partition_name / "data.parquet"
-        table = pq.read_table(partition_path)
-        # Convert to list of dicts for factor computation
-        df = table.to_pandas()
-        # Extract TRD_DD from partition name
-        trade_date = partition_name.split('=')[1]
-        for _, row in df.iterrows():
-            row_dict = row.to_dict()
-            row_dict['TRD_DD'] = trade_date
-            all_snapshots.append(row_dict)
-    
-    print(f"Read {len(all_snapshots)} snapshot rows for factor computation")
-    
-    # Compute and persist factors
-    factor_count = compute_and_persist_adj_factors(all_snapshots, writer)
+    # Read back all snapshots for factor computation in a single dataset scan.
+    # The Hive partitioning spec lets the dataset engine prune partitions by
+    # directory name and inject TRD_DD from the partition path automatically.
+    dates_wanted = [p.split('=')[1] for p in partitions]
+    dataset = ds.dataset(
+        snapshots_dir,
+        format='parquet',
+        partitioning=ds.partitioning(pa.schema([('TRD_DD', pa.string())]), flavor='hive'),
+    )
+    combined = dataset.to_table(
+        filter=ds.field('TRD_DD').isin(dates_wanted),
+    )
+
+    print(f"Read {combined.num_rows} snapshot rows for factor computation")
+
+    # Compute and persist factors (fused single-pass over the Arrow table)
+    factor_count = compute_and_persist_adj_factors_table(combined, writer)
     print(f"Computed {factor_count} adjustment factors")
     
     # Verify factors written
@@ -224,13 +260,12 @@ def test_parquet_ingestion_short_period(temp_parquet_db, raw_client):
         print(f"  Rows: {factor_table.num_rows}")
         print(f"  Schema: {factor_table.schema.names}")
         
-        # Display sample factors
-        factor_df = factor_table.to_pandas()
+        # Display sample factors (slice before pandas: 5 rows materialized)
         print(f"\nSample adjustment factors (first 5):")
-        print(factor_df.head(5))
-        
+        print(factor_table.slice(0, 5).to_pandas())
+
         # Verify most factors are close to 1.0 (no corporate actions)
-        non_null_factors = factor_df['adj_factor'].dropna()
+        non_null_factors = factor_table.column('adj_factor').drop_null().to_pandas()
         if len(non_null_factors) > 0:
             mean_factor = non_null_factors.mean()
             print(f"\nMean adj_factor (non-null): {mean_factor:.6f}")
@@ -241,7 +276,7 @@ def test_parquet_ingestion_short_period(temp_parquet_db, raw_client):
     print(f"\n{'='*60}")
     print("Live smoke test PASSED")
     print(f"{'='*60}")
-    print(f"DB size: {sum(f.stat().st_size for f in temp_parquet_db.rglob('*.parquet')) / 1024 / 1024:.1f} MB")
+    print(f"DB size: {_parquet_db_size(temp_parquet_db) / 1024 / 1024:.1f} MB")
     print(f"Snapshots partitions: {len(partitions)}")
     print(f"Factor partitions: {len(factor_partitions)}")
 
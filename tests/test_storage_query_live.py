@@ -14,6 +14,7 @@ They validate:
 
 import pytest
 import pandas as pd
+import pyarrow.compute as pc
 from pathlib import Path
 
 from krx_quant_dataloader.storage.query import (
@@ -65,8 +66,9 @@ def test_query_parquet_table_snapshots_all_data(krx_db_test_path):
     
     # Validate data
     assert len(df) > 0, "Should have data"
-    assert 'ISU_SRT_CD' in df.columns
-    assert 'TDD_CLSPRC' in df.columns
+    columns = frozenset(df.columns)
+    assert 'ISU_SRT_CD' in columns
+    assert 'TDD_CLSPRC' in columns
     
     print(f"\nTotal rows: {len(df):,}")
     print(f"Unique symbols: {df['ISU_SRT_CD'].nunique()}")
@@ -85,37 +87,40 @@ def test_query_parquet_table_snapshots_symbol_filter(krx_db_test_path):
     print("="*80)
     
     symbols = ['005930', '000660', '035720']  # Samsung, SK Hynix, Kakao
-    
-    df = query_parquet_table(
+
+    table = query_parquet_table(
         db_path=krx_db_test_path,
         table_name='snapshots',
         start_date='20241104',
         end_date='20241105',
         symbols=symbols,
         fields=None,
+        return_arrow=True,
     )
-    
+
     # Validate symbol filtering
-    unique_symbols = df['ISU_SRT_CD'].unique().tolist()
+    unique_symbols = pc.unique(table.column('ISU_SRT_CD')).to_pylist()
     print(f"\nRequested symbols: {symbols}")
     print(f"Found symbols: {unique_symbols}")
-    
+
     assert len(unique_symbols) <= len(symbols), "Should only return requested symbols"
     for sym in unique_symbols:
         assert sym in symbols, f"Unexpected symbol: {sym}"
-    
+
     # Validate dates
-    dates = sorted(df['TRD_DD'].unique())
+    dates = sorted(pc.unique(table.column('TRD_DD')).to_pylist())
     print(f"Dates: {dates}")
     assert len(dates) == 2, f"Expected 2 days, got {len(dates)}"
-    
-    # Show sample data per symbol
+
+    # Show sample data per symbol: filter + slice in Arrow, so only the
+    # handful of displayed rows ever convert to pandas
     print(f"\nSample data per symbol:")
     for sym in symbols:
-        sym_data = df[df['ISU_SRT_CD'] == sym]
-        if len(sym_data) > 0:
-            print(f"\n{sym} ({sym_data['ISU_ABBRV'].iloc[0]}):")
-            print(sym_data[['TRD_DD', 'TDD_CLSPRC', 'ACC_TRDVAL']].to_string())
+        sym_data = table.filter(pc.field('ISU_SRT_CD') == sym).slice(0, 10)
+        if sym_data.num_rows > 0:
+            abbrv = sym_data.column('ISU_ABBRV')[0].as_py()
+            print(f"\n{sym} ({abbrv}):")
+            print(sym_data.select(['TRD_DD', 'TDD_CLSPRC', 'ACC_TRDVAL']).to_pandas().to_string())
 
 
 @pytest.mark.live
@@ -127,30 +132,33 @@ def test_query_parquet_table_snapshots_column_pruning(krx_db_test_path):
     print("="*80)
     
     fields = ['TRD_DD', 'ISU_SRT_CD', 'TDD_CLSPRC']
-    
-    df = query_parquet_table(
+
+    # Arrow table is enough here: schema/num_rows/slice need no pandas
+    # materialization (skips the full BlockManager copy)
+    table = query_parquet_table(
         db_path=krx_db_test_path,
         table_name='snapshots',
         start_date='20241105',
         end_date='20241105',
         symbols=None,
         fields=fields,
+        return_arrow=True,
     )
-    
+
     # Validate columns
     print(f"\nRequested fields: {fields}")
-    print(f"DataFrame columns: {list(df.columns)}")
-    
+    print(f"Table columns: {table.schema.names}")
+
     # Should only have requested columns (plus TRD_DD if not in fields)
     expected_cols = set(fields)
-    actual_cols = set(df.columns)
-    
+    actual_cols = set(table.schema.names)
+
     assert expected_cols.issubset(actual_cols), "Should have all requested fields"
-    assert len(df) > 0, "Should have data"
-    
-    print(f"\nDataFrame shape: {df.shape}")
+    assert table.num_rows > 0, "Should have data"
+
+    print(f"\nTable shape: ({table.num_rows}, {table.num_columns})")
     print(f"Sample data (first 10 rows):")
-    print(df.head(10))
+    print(table.slice(0, 10).to_pandas())  # only 10 rows materialized
 
 
 @pytest.mark.live
@@ -177,9 +185,10 @@ def test_query_parquet_table_adj_factors(krx_db_test_path):
     print(f"\nAdjustment factors found: {len(df)}")
     
     if len(df) > 0:
-        assert 'TRD_DD' in df.columns
-        assert 'ISU_SRT_CD' in df.columns
-        assert 'adj_factor' in df.columns
+        columns = frozenset(df.columns)
+        assert 'TRD_DD' in columns
+        assert 'ISU_SRT_CD' in columns
+        assert 'adj_factor' in columns
         
         print(f"\nColumns: {list(df.columns)}")
         print(f"\nSample factors:")
@@ -0,0 +1,97 @@
+"""
+Unit tests for storage query layer (storage/query.py)
+
+Synthetic-data tests for the query path: partition discovery, the cached
+partition listing, and DataFrame returns. Live smoke coverage against a
+real database lives in test_storage_query_live.py.
+"""
+
+import pytest
+
+from krx_quant_dataloader.pipelines.universe_builder import build_universes_and_persist
+from krx_quant_dataloader.storage.query import query_parquet_table
+from krx_quant_dataloader.storage.writers import ParquetSnapshotWriter
+
+
+def _persist_universes(writer, dates, symbols, ranks):
+    import pandas as pd
+
+    ranks_df = pd.DataFrame({
+        'TRD_DD': dates,
+        'ISU_SRT_CD': symbols,
+        'liquidity_rank': ranks,
+        'ACC_TRDVAL': [1_000_000] * len(dates),
+    })
+    return build_universes_and_persist(
+        ranks_df=ranks_df,
+        universe_tiers={'univ100': 100},
+        writer=writer,
+    )
+
+
+@pytest.mark.unit
+class TestPartitionCacheInvalidation:
+    """Cached partition listings must see partitions written after a query."""
+
+    def test_query_sees_partition_written_after_prior_query(self, tmp_path):
+        writer = ParquetSnapshotWriter(root_path=tmp_path)
+        _persist_universes(writer, ['20240101'], ['STOCK01'], [1])
+
+        # Prime the partition-listing cache with a first query
+        df1 = query_parquet_table(
+            db_path=tmp_path,
+            table_name='universes',
+            start_date='20240101',
+            end_date='20240102',
+        )
+        assert sorted(df1['TRD_DD'].unique()) == ['20240101']
+
+        # Ingest a new date (no close()/explicit invalidation), then re-query:
+        # the new partition must not be silently treated as a holiday
+        _persist_universes(writer, ['20240102'], ['STOCK01'], [1])
+
+        df2 = query_parquet_table(
+            db_path=tmp_path,
+            table_name='universes',
+            start_date='20240101',
+            end_date='20240102',
+        )
+        assert sorted(df2['TRD_DD'].unique()) == ['20240101', '20240102']
+
+
+@pytest.mark.unit
+class TestReturnDtypes:
+    """The default return keeps the numpy-backed dtype contract."""
+
+    def test_default_return_is_numpy_backed(self, tmp_path):
+        import pandas as pd
+
+        writer = ParquetSnapshotWriter(root_path=tmp_path)
+        _persist_universes(writer, ['20240101'], ['STOCK01'], [1])
+
+        df = query_parquet_table(
+            db_path=tmp_path,
+            table_name='universes',
+            start_date='20240101',
+            end_date='20240101',
+        )
+        # No ArrowDtype/Categorical surprises on the default path
+        assert not isinstance(df['TRD_DD'].dtype, pd.CategoricalDtype)
+        assert not any(
+            isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes
+        )
+
+    def test_arrow_backed_opt_in(self, tmp_path):
+        import pandas as pd
+
+        writer = ParquetSnapshotWriter(root_path=tmp_path)
+        _persist_universes(writer, ['20240101'], ['STOCK01'], [1])
+
+        df = query_parquet_table(
+            db_path=tmp_path,
+            table_name='universes',
+            start_date='20240101',
+            end_date='20240101',
+            arrow_backed=True,
+        )
+        assert isinstance(df['ISU_SRT_CD'].dtype, pd.ArrowDtype)
@@ -0,0 +1,188 @@
+"""
+Unit tests for storage writers (storage/writers.py)
+
+Synthetic-data tests for the Parquet writer's newer entry points: the
+RecordBatch snapshot path, the buffered batch/flush/close cycle, and the
+prebuilt-table universe path with its sorted_by metadata handshake. Live
+smoke coverage against real KRX data lives in
+test_storage_parquet_live_smoke.py.
+"""
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from krx_quant_dataloader.storage.schema import SNAPSHOTS_SCHEMA, UNIVERSES_SCHEMA
+from krx_quant_dataloader.storage.writers import ParquetSnapshotWriter
+
+
+def _snapshot_row(symbol: str, close: int) -> dict:
+    return {
+        'ISU_SRT_CD': symbol,
+        'ISU_ABBRV': f'Stock {symbol}',
+        'MKT_NM': 'KOSPI',
+        'BAS_PRC': close,
+        'TDD_CLSPRC': close,
+        'CMPPREVDD_PRC': 0,
+        'ACC_TRDVOL': 1000,
+        'ACC_TRDVAL': close * 1000,
+        'FLUC_RT': '0.00',
+        'FLUC_TP': '3',
+        'MKT_ID': 'STK',
+    }
+
+
+def _read_partition(table_path, date):
+    return pq.read_table(table_path / f"TRD_DD={date}" / "data.parquet")
+
+
+@pytest.mark.unit
+class TestWriteSnapshotBatch:
+    """Columnar RecordBatch path of the snapshots writer."""
+
+    def test_writes_partition_sorted_by_symbol(self, tmp_path):
+        writer = ParquetSnapshotWriter(root_path=tmp_path)
+        # Unsorted symbols, with a TRD_DD column the writer must strip
+        rows = [_snapshot_row('B002', 200), _snapshot_row('A001', 100)]
+        for row in rows:
+            row['TRD_DD'] = '20240101'
+        batch = pa.RecordBatch.from_pylist(rows)
+
+        count = writer.write_snapshot_batch(batch, trd_dd='20240101')
+        assert count == 2
+
+        result = _read_partition(writer.snapshots_path, '20240101')
+        assert result.schema.names == SNAPSHOTS_SCHEMA.names
+        assert result.column('ISU_SRT_CD').to_pylist() == ['A001', 'B002']
+
+    def test_empty_batch_writes_nothing(self, tmp_path):
+        writer = ParquetSnapshotWriter(root_path=tmp_path)
+        batch = pa.RecordBatch.from_pylist([], schema=SNAPSHOTS_SCHEMA)
+
+        assert writer.write_snapshot_batch(batch, trd_dd='20240101') == 0
+        assert not (writer.snapshots_path / 'TRD_DD=20240101').exists()
+
+
+@pytest.mark.unit
+class TestWriteSnapshotBatches:
+    """Buffered multi-day path: batches accumulate, flush materializes."""
+
+    def _two_day_batches(self):
+        return [
+            ('20240101', [dict(_snapshot_row('A001', 100), TRD_DD='20240101')]),
+            ('20240102', [dict(_snapshot_row('A001', 110), TRD_DD='20240102')]),
+        ]
+
+    def test_buffering_defers_writes_until_flush(self, tmp_path):
+        writer = ParquetSnapshotWriter(root_path=tmp_path)
+
+        buffered = writer.write_snapshot_batches(self._two_day_batches())
+        assert buffered == 2
+        # Nothing on disk yet: write_snapshot_batches only buffers
+        assert not writer.snapshots_path.exists()
+
+        written = writer.flush()
+        assert written == 2
+        for date in ('20240101', '20240102'):
+            result = _read_partition(writer.snapshots_path, date)
+            assert result.num_rows == 1
+
+    def test_flush_drains_pending(self, tmp_path):
+        writer = ParquetSnapshotWriter(root_path=tmp_path)
+        writer.write_snapshot_batches(self._two_day_batches())
+
+        assert writer.flush() == 2
+        # Buffer is drained: a second flush has nothing to write
+        assert writer.flush() == 0
+
+    def test_close_flushes_pending(self, tmp_path):
+        writer = ParquetSnapshotWriter(root_path=tmp_path)
+        writer.write_snapshot_batches(self._two_day_batches())
+
+        writer.close()
+
+        for date in ('20240101', '20240102'):
+            result = _read_partition(writer.snapshots_path, date)
+            assert result.num_rows == 1
+
+
+@pytest.mark.unit
+class TestWriteUniversesTable:
+    """Prebuilt Arrow-table universe path, including the sort handshake."""
+
+    def _universe_table(self, symbols, ranks, *, metadata=None):
+        table = pa.table({
+            'TRD_DD': ['20240101'] * len(symbols),
+            'ISU_SRT_CD': symbols,
+            'univ100': [1] * len(symbols),
+            'univ200': [1] * len(symbols),
+            'univ500': [1] * len(symbols),
+            'univ1000': [1] * len(symbols),
+            'liquidity_rank': ranks,
+        })
+        if metadata:
+            table = table.replace_schema_metadata(metadata)
+        return table
+
+    def test_unsorted_table_sorted_on_write(self, tmp_path):
+        writer = ParquetSnapshotWriter(root_path=tmp_path)
+        table = self._universe_table(['B002', 'A001'], [2, 1])
+
+        count = writer.write_universes_table(table, date='20240101')
+        assert count == 2
+
+        result = _read_partition(tmp_path / 'universes', '20240101')
+        assert result.schema.names == UNIVERSES_SCHEMA.names
+        assert result.column('ISU_SRT_CD').to_pylist() == ['A001', 'B002']
+
+    def test_sorted_by_metadata_trusted(self, tmp_path):
+        writer = ParquetSnapshotWriter(root_path=tmp_path)
+        # The marker asserts the table is already date/symbol sorted; the
+        # writer must preserve the order as-is rather than re-sorting
+        table = self._universe_table(
+            ['A001', 'B002'], [1, 2],
+            metadata={b'sorted_by': b'TRD_DD,ISU_SRT_CD'},
+        )
+
+        writer.write_universes_table(table, date='20240101')
+
+        result = _read_partition(tmp_path / 'universes', '20240101')
+        assert result.column('ISU_SRT_CD').to_pylist() == ['A001', 'B002']
+        assert result.column('liquidity_rank').to_pylist() == [1, 2]
+
+    def test_per_date_write_replaces_dataset_files(self, tmp_path):
+        """Per-date writes must clear data-*.parquet left by the dataset path."""
+        writer = ParquetSnapshotWriter(root_path=tmp_path)
+        writer.write_universes_dataset({
+            'TRD_DD': ['20240101', '20240101', '20240101'],
+            'ISU_SRT_CD': ['A001', 'B002', 'C003'],
+            'univ100': [1, 1, 1],
+            'univ200': [1, 1, 1],
+            'univ500': [1, 1, 1],
+            'univ1000': [1, 1, 1],
+            'liquidity_rank': [1, 2, 3],
+        })
+
+        # Rewrite the same partition via the per-date table path: the
+        # dataset file must not survive to double-count in directory scans
+        writer.write_universes_table(
+            self._universe_table(['A001', 'B002'], [1, 2]), date='20240101'
+        )
+
+        partition = tmp_path / 'universes' / 'TRD_DD=20240101'
+        assert sorted(p.name for p in partition.glob('*.parquet')) == ['data.parquet']
+        assert _read_partition(tmp_path / 'universes', '20240101').num_rows == 2
+
+    def test_rewrite_after_rmtree(self, tmp_path):
+        """Same-process rebuild: rmtree the table, then write again."""
+        import shutil
+
+        writer = ParquetSnapshotWriter(root_path=tmp_path)
+        table = self._universe_table(['A001'], [1])
+
+        writer.write_universes_table(table, date='20240101')
+        shutil.rmtree(tmp_path / 'universes')
+        writer.write_universes_table(table, date='20240101')
+
+        result = _read_partition(tmp_path / 'universes', '20240101')
+        assert result.num_rows == 1
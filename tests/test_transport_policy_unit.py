@@ -1,3 +1,5 @@
+from collections import deque
+
 import pytest
 
 
@@ -12,7 +14,7 @@ class _FakeResp:
 
 class _FakeHTTP:
     def __init__(self, responses):
-        self._responses = list(responses)
+        self._responses = deque(responses)  # O(1) popleft vs list.pop(0)
         self.calls = []
 
     def request(self, method, url, *, headers=None, params=None, data=None, timeout=None):
@@ -26,7 +28,7 @@ class _FakeHTTP:
         })
         if not self._responses:
             raise RuntimeError("No more fake responses queued")
-        return self._responses.pop(0)
+        return self._responses.popleft()
 
 
 class _FakeRateLimiter:
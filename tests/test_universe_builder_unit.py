@@ -5,33 +5,96 @@ Tests the build_universes() function that constructs universe membership
 from liquidity ranks using boolean columns. Uses synthetic data.
 """
 
+import numpy as np
 import pytest
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from pathlib import Path
 
+from krx_quant_dataloader.pipelines import universe_builder
+from krx_quant_dataloader.pipelines.universe_builder import (
+    build_universes,
+    build_universes_arrow,
+    build_universe_mask,
+    build_universes_and_persist,
+    in_tier,
+)
+from krx_quant_dataloader.storage.writers import ParquetSnapshotWriter
+
+
+def _stock_ids(n: int) -> np.ndarray:
+    """STOCK01..STOCKnn symbol array built in one vectorized shot."""
+    return np.char.add('STOCK', np.char.zfill(np.arange(1, n + 1).astype('U'), 2))
+
+
+def _mk_ranks(dates, symbols, ranks, vals) -> pd.DataFrame:
+    """Build a ranks frame from column arrays (no per-row dict boxing)."""
+    return pd.DataFrame({
+        'TRD_DD': np.asarray(dates),
+        'ISU_SRT_CD': np.asarray(symbols),
+        'liquidity_rank': np.asarray(ranks, dtype=np.int32),
+        'ACC_TRDVAL': np.asarray(vals),
+    }, copy=False)
+
+
+# Shared synthetic ranks frames, built once per module (tests treat them as
+# read-only; build_universes never mutates its input). Columnar construction:
+# no per-row dict boxing or row-wise dtype inference.
+
+@pytest.fixture(scope="module")
+def ranks_5():
+    """Five stocks with sequential ranks 1..5 on one date."""
+    return _mk_ranks(
+        np.full(5, '20240101'), _stock_ids(5),
+        np.arange(1, 6), 1_000_000 - np.arange(0, 5) * 100_000,
+    )
+
+
+@pytest.fixture(scope="module")
+def ranks_10():
+    """Ten stocks with sequential ranks 1..10 on one date."""
+    return _mk_ranks(
+        np.full(10, '20240101'), _stock_ids(10),
+        np.arange(1, 11), 1_000_000 - np.arange(1, 11) * 10_000,
+    )
+
+
+@pytest.fixture(scope="module")
+def universes_mixed_by_symbol(ranks_mixed):
+    """One shared build over ranks_mixed, as a symbol -> row mapping.
+
+    One itertuples pass builds the dict; each lookup is then a plain hash
+    probe with no Index machinery at all.
+    """
+    result = build_universes(
+        ranks_df=ranks_mixed,
+        universe_tiers={'univ100': 100, 'univ200': 200, 'univ500': 500, 'univ1000': 1000},
+    )
+    return {row.ISU_SRT_CD: row for row in result.itertuples(index=False)}
+
+
+@pytest.fixture(scope="module")
+def ranks_mixed():
+    """Five stocks with ranks straddling each tier threshold."""
+    return _mk_ranks(
+        np.full(5, '20240101'), _stock_ids(5),
+        np.array([50, 150, 300, 600, 1500]),
+        1_000_000 - np.arange(0, 5) * 100_000,
+    )
+
 
 @pytest.mark.unit
 class TestBuildUniversesLogic:
     """Test universe construction logic with synthetic data."""
-    
-    def test_single_date_single_universe(self):
+
+    def test_single_date_single_universe(self, ranks_5):
         """Test building with boolean columns for one date."""
-        from krx_quant_dataloader.pipelines.universe_builder import build_universes
-        
-        # Synthetic liquidity ranks
-        ranks_df = pd.DataFrame([
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'STOCK01', 'liquidity_rank': 1, 'ACC_TRDVAL': 1000000},
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'STOCK02', 'liquidity_rank': 2, 'ACC_TRDVAL': 900000},
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'STOCK03', 'liquidity_rank': 3, 'ACC_TRDVAL': 800000},
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'STOCK04', 'liquidity_rank': 4, 'ACC_TRDVAL': 700000},
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'STOCK05', 'liquidity_rank': 5, 'ACC_TRDVAL': 600000},
-        ])
-        
         # Build with standard tier
         universe_tiers = {'univ100': 100}
-        
+
         result = build_universes(
-            ranks_df=ranks_df,
+            ranks_df=ranks_5,
             universe_tiers=universe_tiers,
         )
         
@@ -41,21 +104,13 @@ class TestBuildUniversesLogic:
         # All 5 stocks should have univ100=1 (since threshold is 100 and we only have 5 stocks)
         assert (result['univ100'] == 1).all()
     
-    def test_multiple_universes_subset_relationship(self):
+    def test_multiple_universes_subset_relationship(self, ranks_10):
         """Test that subset relationships are explicit in boolean columns."""
-        from krx_quant_dataloader.pipelines.universe_builder import build_universes
-        
-        # Create 10 stocks
-        ranks_df = pd.DataFrame([
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': f'STOCK{i:02d}', 'liquidity_rank': i, 'ACC_TRDVAL': 1000000 - i*10000}
-            for i in range(1, 11)
-        ])
-        
         # Build standard tiers
         universe_tiers = {'univ100': 100, 'univ200': 200, 'univ500': 500, 'univ1000': 1000}
-        
+
         result = build_universes(
-            ranks_df=ranks_df,
+            ranks_df=ranks_10,
             universe_tiers=universe_tiers,
         )
         
@@ -75,19 +130,14 @@ class TestBuildUniversesLogic:
     
     def test_multiple_dates_cross_sectional_independence(self):
         """Test universe construction preserves per-date independence."""
-        from krx_quant_dataloader.pipelines.universe_builder import build_universes
-        
-        # Same stocks, different ranks per date
-        ranks_df = pd.DataFrame([
-            # Date 1: STOCK01 is #1, STOCK02 is #2
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'STOCK01', 'liquidity_rank': 1, 'ACC_TRDVAL': 1000000},
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'STOCK02', 'liquidity_rank': 2, 'ACC_TRDVAL': 900000},
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'STOCK03', 'liquidity_rank': 3, 'ACC_TRDVAL': 800000},
-            # Date 2: STOCK03 is #1, STOCK01 is #2
-            {'TRD_DD': '20240102', 'ISU_SRT_CD': 'STOCK03', 'liquidity_rank': 1, 'ACC_TRDVAL': 1000000},
-            {'TRD_DD': '20240102', 'ISU_SRT_CD': 'STOCK01', 'liquidity_rank': 2, 'ACC_TRDVAL': 900000},
-            {'TRD_DD': '20240102', 'ISU_SRT_CD': 'STOCK02', 'liquidity_rank': 3, 'ACC_TRDVAL': 800000},
-        ])
+        # Same stocks, different ranks per date:
+        # Date 1: STOCK01 is #1, STOCK02 is #2 / Date 2: STOCK03 is #1
+        ranks_df = _mk_ranks(
+            np.repeat(['20240101', '20240102'], 3),
+            ['STOCK01', 'STOCK02', 'STOCK03', 'STOCK03', 'STOCK01', 'STOCK02'],
+            np.tile(np.arange(1, 4), 2),
+            np.tile([1_000_000, 900_000, 800_000], 2),
+        )
         
         universe_tiers = {'univ100': 100, 'univ200': 200}
         
@@ -104,64 +154,30 @@ class TestBuildUniversesLogic:
         assert (result['univ100'] == 1).all()
         assert (result['univ200'] == 1).all()
     
-    def test_stocks_boolean_flags_correct(self):
-        """Test that boolean flags are correctly set based on rank thresholds."""
-        from krx_quant_dataloader.pipelines.universe_builder import build_universes
-        
-        ranks_df = pd.DataFrame([
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'STOCK01', 'liquidity_rank': 50, 'ACC_TRDVAL': 1000000},
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'STOCK02', 'liquidity_rank': 150, 'ACC_TRDVAL': 900000},
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'STOCK03', 'liquidity_rank': 300, 'ACC_TRDVAL': 800000},
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'STOCK04', 'liquidity_rank': 600, 'ACC_TRDVAL': 700000},
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'STOCK05', 'liquidity_rank': 1500, 'ACC_TRDVAL': 600000},
-        ])
-        
-        universe_tiers = {'univ100': 100, 'univ200': 200, 'univ500': 500, 'univ1000': 1000}
-        
-        result = build_universes(
-            ranks_df=ranks_df,
-            universe_tiers=universe_tiers,
-        )
-        
-        # STOCK01 (rank 50): in all universes
-        stock01 = result[result['ISU_SRT_CD'] == 'STOCK01'].iloc[0]
-        assert stock01['univ100'] == 1
-        assert stock01['univ200'] == 1
-        assert stock01['univ500'] == 1
-        assert stock01['univ1000'] == 1
-        
-        # STOCK02 (rank 150): not in univ100, but in univ200+
-        stock02 = result[result['ISU_SRT_CD'] == 'STOCK02'].iloc[0]
-        assert stock02['univ100'] == 0
-        assert stock02['univ200'] == 1
-        assert stock02['univ500'] == 1
-        assert stock02['univ1000'] == 1
-        
-        # STOCK03 (rank 300): only in univ500+
-        stock03 = result[result['ISU_SRT_CD'] == 'STOCK03'].iloc[0]
-        assert stock03['univ100'] == 0
-        assert stock03['univ200'] == 0
-        assert stock03['univ500'] == 1
-        assert stock03['univ1000'] == 1
-        
-        # STOCK04 (rank 600): only in univ1000
-        stock04 = result[result['ISU_SRT_CD'] == 'STOCK04'].iloc[0]
-        assert stock04['univ100'] == 0
-        assert stock04['univ200'] == 0
-        assert stock04['univ500'] == 0
-        assert stock04['univ1000'] == 1
-        
-        # STOCK05 (rank 1500): not in any universe
-        stock05 = result[result['ISU_SRT_CD'] == 'STOCK05'].iloc[0]
-        assert stock05['univ100'] == 0
-        assert stock05['univ200'] == 0
-        assert stock05['univ500'] == 0
-        assert stock05['univ1000'] == 0
+    @pytest.mark.parametrize('stock, expected', [
+        # rank 50: in all universes
+        ('STOCK01', {'univ100': 1, 'univ200': 1, 'univ500': 1, 'univ1000': 1}),
+        # rank 150: not in univ100, but in univ200+
+        ('STOCK02', {'univ100': 0, 'univ200': 1, 'univ500': 1, 'univ1000': 1}),
+        # rank 300: only in univ500+
+        ('STOCK03', {'univ100': 0, 'univ200': 0, 'univ500': 1, 'univ1000': 1}),
+        # rank 600: only in univ1000
+        ('STOCK04', {'univ100': 0, 'univ200': 0, 'univ500': 0, 'univ1000': 1}),
+        # rank 1500: not in any universe
+        ('STOCK05', {'univ100': 0, 'univ200': 0, 'univ500': 0, 'univ1000': 0}),
+    ])
+    def test_stocks_boolean_flags_correct(self, universes_mixed_by_symbol, stock, expected):
+        """Test that boolean flags are correctly set based on rank thresholds.
+
+        The pipeline runs once (module-scoped fixture); each case is one
+        dict lookup instead of a boolean-mask scan.
+        """
+        row = universes_mixed_by_symbol[stock]
+        for tier, flag in expected.items():
+            assert getattr(row, tier) == flag
     
     def test_empty_ranks_returns_empty_result(self):
         """Test that empty ranks DataFrame returns empty result."""
-        from krx_quant_dataloader.pipelines.universe_builder import build_universes
-        
         ranks_df = pd.DataFrame(columns=['TRD_DD', 'ISU_SRT_CD', 'liquidity_rank', 'ACC_TRDVAL'])
         universe_tiers = {'univ100': 100}
         
@@ -172,19 +188,14 @@ class TestBuildUniversesLogic:
         
         assert len(result) == 0
     
-    def test_fewer_stocks_than_threshold(self):
+    def test_fewer_stocks_than_threshold(self, ranks_5):
         """Test universe construction when fewer stocks than threshold exist."""
-        from krx_quant_dataloader.pipelines.universe_builder import build_universes
-        
-        # Only 3 stocks, but requesting univ100
-        ranks_df = pd.DataFrame([
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'STOCK01', 'liquidity_rank': 1, 'ACC_TRDVAL': 1000000},
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'STOCK02', 'liquidity_rank': 2, 'ACC_TRDVAL': 900000},
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'STOCK03', 'liquidity_rank': 3, 'ACC_TRDVAL': 800000},
-        ])
-        
+        # Only 3 stocks, but requesting univ100 (slice is a cheap view
+        # under copy-on-write)
+        ranks_df = ranks_5.iloc[:3]
+
         universe_tiers = {'univ100': 100}
-        
+
         result = build_universes(
             ranks_df=ranks_df,
             universe_tiers=universe_tiers,
@@ -201,11 +212,7 @@ class TestBuildUniversesOutputFormat:
     
     def test_output_has_required_columns(self):
         """Test that output contains all required columns."""
-        from krx_quant_dataloader.pipelines.universe_builder import build_universes
-        
-        ranks_df = pd.DataFrame([
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'STOCK01', 'liquidity_rank': 1, 'ACC_TRDVAL': 1000000},
-        ])
+        ranks_df = _mk_ranks(['20240101'], ['STOCK01'], [1], [1_000_000])
         
         universe_tiers = {'univ100': 100}
         
@@ -225,11 +232,7 @@ class TestBuildUniversesOutputFormat:
     
     def test_output_rank_dtype(self):
         """Test that liquidity_rank is integer type."""
-        from krx_quant_dataloader.pipelines.universe_builder import build_universes
-        
-        ranks_df = pd.DataFrame([
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'STOCK01', 'liquidity_rank': 1, 'ACC_TRDVAL': 1000000},
-        ])
+        ranks_df = _mk_ranks(['20240101'], ['STOCK01'], [1], [1_000_000])
         
         universe_tiers = {'univ100': 100}
         
@@ -245,15 +248,24 @@ class TestBuildUniversesOutputFormat:
         assert pd.api.types.is_integer_dtype(result['univ100'])
         assert result['univ100'].isin([0, 1]).all()
     
+    def test_output_flag_dtypes_uniform(self, ranks_5):
+        """Every requested flag column comes back int8 from one build."""
+        result = build_universes(
+            ranks_df=ranks_5,
+            universe_tiers={'univ100': 100, 'univ200': 200},
+        )
+
+        for name in ('univ100', 'univ200'):
+            assert result[name].dtype == np.int8, name
+
     def test_output_sorted_by_date_and_symbol(self):
         """Test that output is sorted by TRD_DD and ISU_SRT_CD."""
-        from krx_quant_dataloader.pipelines.universe_builder import build_universes
-        
-        ranks_df = pd.DataFrame([
-            {'TRD_DD': '20240102', 'ISU_SRT_CD': 'STOCK03', 'liquidity_rank': 3, 'ACC_TRDVAL': 800000},
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'STOCK02', 'liquidity_rank': 2, 'ACC_TRDVAL': 900000},
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'STOCK01', 'liquidity_rank': 1, 'ACC_TRDVAL': 1000000},
-        ])
+        ranks_df = _mk_ranks(
+            ['20240102', '20240101', '20240101'],
+            ['STOCK03', 'STOCK02', 'STOCK01'],
+            [3, 2, 1],
+            [800_000, 900_000, 1_000_000],
+        )
         
         universe_tiers = {'univ100': 100}
         
@@ -275,101 +287,176 @@ class TestBuildUniversesOutputFormat:
 
 @pytest.mark.unit
 class TestBuildUniversesWithPersistence:
-    """Test persistence via build_universes_and_persist()."""
-    
-    def test_writes_to_database(self, tmp_path):
+    """Test persistence via build_universes_and_persist().
+
+    One root directory and writer are shared across the class (class-scoped
+    fixture); each test writes partitions for dates it alone uses, so the
+    shared root keeps the tests isolated.
+    """
+
+    @pytest.fixture(scope="class")
+    def persistence_ctx(self, tmp_path_factory):
+        root = tmp_path_factory.mktemp('universes_root')
+        return root, ParquetSnapshotWriter(root_path=root)
+
+    def test_writes_to_database(self, persistence_ctx):
         """Test that build_universes_and_persist() writes to database."""
-        from krx_quant_dataloader.pipelines.universe_builder import build_universes_and_persist
-        from krx_quant_dataloader.storage.writers import ParquetSnapshotWriter
-        
-        ranks_df = pd.DataFrame([
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'STOCK01', 'liquidity_rank': 1, 'ACC_TRDVAL': 1000000},
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'STOCK02', 'liquidity_rank': 2, 'ACC_TRDVAL': 900000},
-        ])
-        
+        root, writer = persistence_ctx
+        ranks_df = _mk_ranks(
+            np.full(2, '20240101'), ['STOCK01', 'STOCK02'],
+            [1, 2], [1_000_000, 900_000],
+        )
+
         universe_tiers = {'univ100': 100}
-        
-        writer = ParquetSnapshotWriter(root_path=tmp_path)
-        
+
         row_count = build_universes_and_persist(
             ranks_df=ranks_df,
             universe_tiers=universe_tiers,
             writer=writer,
         )
-        
+
         # Should write 2 rows
         assert row_count == 2
-        
+
         # Check file exists
-        partition_path = tmp_path / 'universes' / 'TRD_DD=20240101'
+        partition_path = root / 'universes' / 'TRD_DD=20240101'
         assert partition_path.exists()
-    
-    def test_per_date_partitioning(self, tmp_path):
+
+    def test_per_date_partitioning(self, persistence_ctx):
         """Test that universes are partitioned by TRD_DD."""
-        from krx_quant_dataloader.pipelines.universe_builder import build_universes_and_persist
-        from krx_quant_dataloader.storage.writers import ParquetSnapshotWriter
-        
-        ranks_df = pd.DataFrame([
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'STOCK01', 'liquidity_rank': 1, 'ACC_TRDVAL': 1000000},
-            {'TRD_DD': '20240102', 'ISU_SRT_CD': 'STOCK01', 'liquidity_rank': 1, 'ACC_TRDVAL': 1000000},
-        ])
-        
+        root, writer = persistence_ctx
+        ranks_df = _mk_ranks(
+            ['20240201', '20240202'], np.full(2, 'STOCK01'),
+            [1, 1], np.full(2, 1_000_000),
+        )
+
         universe_tiers = {'univ100': 100}
-        
-        writer = ParquetSnapshotWriter(root_path=tmp_path)
-        
+
         build_universes_and_persist(
             ranks_df=ranks_df,
             universe_tiers=universe_tiers,
             writer=writer,
         )
-        
+
         # Check both partitions exist
-        assert (tmp_path / 'universes' / 'TRD_DD=20240101').exists()
-        assert (tmp_path / 'universes' / 'TRD_DD=20240102').exists()
-    
-    def test_idempotent_overwrites(self, tmp_path):
+        assert (root / 'universes' / 'TRD_DD=20240201').exists()
+        assert (root / 'universes' / 'TRD_DD=20240202').exists()
+
+    def test_idempotent_overwrites(self, persistence_ctx):
         """Test that re-running with same data overwrites existing partitions."""
-        from krx_quant_dataloader.pipelines.universe_builder import build_universes_and_persist
-        from krx_quant_dataloader.storage.writers import ParquetSnapshotWriter
-        
-        ranks_df = pd.DataFrame([
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'STOCK01', 'liquidity_rank': 1, 'ACC_TRDVAL': 1000000},
-        ])
-        
+        _, writer = persistence_ctx
+        ranks_df = _mk_ranks(['20240301'], ['STOCK01'], [1], [1_000_000])
+
         universe_tiers = {'univ100': 100}
-        
-        writer = ParquetSnapshotWriter(root_path=tmp_path)
-        
+
         # Write once
         count1 = build_universes_and_persist(
             ranks_df=ranks_df,
             universe_tiers=universe_tiers,
             writer=writer,
         )
-        
+
         # Write again (should overwrite)
         count2 = build_universes_and_persist(
             ranks_df=ranks_df,
             universe_tiers=universe_tiers,
             writer=writer,
         )
-        
+
         assert count1 == count2 == 1
 
 
+@pytest.mark.unit
+class TestBuildUniversesArrow:
+    """Test the Arrow-native builder sibling; assertions stay in Arrow."""
+
+    def test_matches_pandas_builder(self, ranks_mixed):
+        """Arrow output must agree with the DataFrame builder column-for-column."""
+        universe_tiers = {'univ100': 100, 'univ200': 200, 'univ500': 500, 'univ1000': 1000}
+
+        table = build_universes_arrow(ranks_mixed, universe_tiers)
+        df = build_universes(ranks_df=ranks_mixed, universe_tiers=universe_tiers)
+
+        assert table.num_rows == len(df)
+        for col in df.columns:
+            assert table.column(col).to_pylist() == df[col].tolist()
+
+    def test_tier_membership_filtered_in_arrow(self, ranks_mixed):
+        """Membership checks run as Arrow filter kernels, no pandas masks."""
+        universe_tiers = {'univ100': 100, 'univ200': 200, 'univ500': 500, 'univ1000': 1000}
+
+        table = build_universes_arrow(ranks_mixed, universe_tiers)
+
+        in_univ200 = pc.equal(table.column('univ200'), 1)
+        members = set(table.filter(in_univ200).column('ISU_SRT_CD').to_pylist())
+        assert members == {'STOCK01', 'STOCK02'}
+
+    def test_output_monotonic_order(self):
+        """(TRD_DD, ISU_SRT_CD) ordering checked with one shifted compare.
+
+        Adjacent-pair less_equal over slices replaces the tolist()+sorted()
+        pattern: no Python list copy and no O(N log N) re-sort to assert
+        an O(N) property.
+        """
+        ranks_df = _mk_ranks(
+            ['20240102', '20240101', '20240101', '20240102'],
+            ['STOCK01', 'STOCK02', 'STOCK01', 'STOCK02'],
+            [1, 2, 1, 2],
+            [4, 3, 2, 1],
+        )
+
+        table = build_universes_arrow(ranks_df, {'univ100': 100})
+        dates = table.column('TRD_DD').combine_chunks()
+        symbols = table.column('ISU_SRT_CD').combine_chunks()
+        n = len(dates)
+
+        assert pc.all(
+            pc.less_equal(dates.slice(0, n - 1), dates.slice(1))
+        ).as_py()
+
+        # Symbols must ascend wherever the date does not change
+        same_date = pc.equal(dates.slice(0, n - 1), dates.slice(1))
+        symbols_ascend = pc.less_equal(symbols.slice(0, n - 1), symbols.slice(1))
+        assert pc.all(pc.if_else(same_date, symbols_ascend, True)).as_py()
+
+
+@pytest.mark.unit
+class TestBuildUniverseMask:
+    """Test the packed uint16 universe representation."""
+
+    def test_mask_matches_wide_flags(self, ranks_mixed):
+        """Unpacked mask bits must agree with the wide int8 columns."""
+        universe_tiers = {'univ100': 100, 'univ200': 200, 'univ500': 500, 'univ1000': 1000}
+
+        wide = build_universes(ranks_df=ranks_mixed, universe_tiers=universe_tiers)
+        masked = build_universe_mask(ranks_df=ranks_mixed, universe_tiers=universe_tiers)
+
+        assert masked['univ_mask'].dtype == np.uint16
+        for tier in ['univ100', 'univ200', 'univ500', 'univ1000']:
+            assert (in_tier(masked, tier) == (wide[tier] == 1).to_numpy()).all()
+
+    def test_mask_empty_input(self):
+        """Empty ranks produce an empty mask frame."""
+        ranks_df = pd.DataFrame(columns=['TRD_DD', 'ISU_SRT_CD', 'liquidity_rank', 'ACC_TRDVAL'])
+
+        result = build_universe_mask(ranks_df=ranks_df, universe_tiers={'univ100': 100})
+
+        assert len(result) == 0
+        assert 'univ_mask' in result.columns
+
+
 @pytest.mark.unit
 class TestBuildUniversesEdgeCases:
     """Test edge cases and error handling."""
     
     def test_missing_required_columns_raises(self):
         """Test that missing required columns raises KeyError."""
-        from krx_quant_dataloader.pipelines.universe_builder import build_universes
-        
         # Missing liquidity_rank
-        ranks_df = pd.DataFrame([
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'STOCK01', 'ACC_TRDVAL': 1000000},
-        ])
+        ranks_df = pd.DataFrame({
+            'TRD_DD': ['20240101'],
+            'ISU_SRT_CD': ['STOCK01'],
+            'ACC_TRDVAL': [1_000_000],
+        })
         
         universe_tiers = {'univ100': 100}
         
@@ -379,19 +466,175 @@ class TestBuildUniversesEdgeCases:
                 universe_tiers=universe_tiers,
             )
     
+    def test_rank_beyond_int16_raises(self):
+        """Ranks that would wrap the int16 output column raise, never truncate."""
+        ranks_df = _mk_ranks(['20240101'], ['STOCK01'], [40_000], [1_000_000])
+
+        with pytest.raises(ValueError, match="int16"):
+            build_universes(ranks_df=ranks_df, universe_tiers={'univ100': 100})
+
+    def test_null_ranks_excluded(self):
+        """A stock with a null liquidity_rank belongs to no universe."""
+        ranks_df = pd.DataFrame({
+            'TRD_DD': ['20240101', '20240101'],
+            'ISU_SRT_CD': ['STOCK01', 'STOCK02'],
+            'liquidity_rank': [1.0, np.nan],
+            'ACC_TRDVAL': [1_000_000, 900_000],
+        })
+
+        result = build_universes(ranks_df=ranks_df, universe_tiers={'univ100': 100})
+
+        assert result['ISU_SRT_CD'].tolist() == ['STOCK01']
+        assert result['univ100'].tolist() == [1]
+
+    def test_null_ranks_excluded_arrow_backed(self):
+        """Arrow-backed nullable rank columns (query_parquet_table output) work."""
+        ranks_df = pd.DataFrame({
+            'TRD_DD': ['20240101', '20240101'],
+            'ISU_SRT_CD': ['STOCK01', 'STOCK02'],
+            'liquidity_rank': pd.array([1, None], dtype=pd.ArrowDtype(pa.int32())),
+            'ACC_TRDVAL': [1_000_000, 900_000],
+        })
+
+        result = build_universes(ranks_df=ranks_df, universe_tiers={'univ100': 100})
+
+        assert result['ISU_SRT_CD'].tolist() == ['STOCK01']
+        assert result['liquidity_rank'].tolist() == [1]
+
     def test_empty_universe_tiers(self):
         """Test that empty universe_tiers returns empty result."""
-        from krx_quant_dataloader.pipelines.universe_builder import build_universes
-        
-        ranks_df = pd.DataFrame([
-            {'TRD_DD': '20240101', 'ISU_SRT_CD': 'STOCK01', 'liquidity_rank': 1, 'ACC_TRDVAL': 1000000},
-        ])
-        
+        ranks_df = _mk_ranks(['20240101'], ['STOCK01'], [1], [1_000_000])
+
         universe_tiers = {}
-        
+
         result = build_universes(
             ranks_df=ranks_df,
             universe_tiers=universe_tiers,
         )
-        
+
         assert len(result) == 0
+
+    def test_in_place_mutation_does_not_serve_stale_sort(self):
+        """Mutating a frame in place must not reuse the old sort permutation."""
+        ranks_df = _mk_ranks(
+            ['20240102', '20240101'], ['STOCK01', 'STOCK02'], [1, 2],
+            [1_000_000, 900_000],
+        )
+        first = build_universes(ranks_df=ranks_df, universe_tiers={'univ100': 100})
+        assert first['TRD_DD'].tolist() == ['20240101', '20240102']
+
+        # Same frame object, new sort keys: the stale permutation would
+        # return ['20240103', '20240101']
+        ranks_df.loc[:, 'TRD_DD'] = ['20240101', '20240103']
+        second = build_universes(ranks_df=ranks_df, universe_tiers={'univ100': 100})
+        assert second['TRD_DD'].tolist() == ['20240101', '20240103']
+        assert second['ISU_SRT_CD'].tolist() == ['STOCK01', 'STOCK02']
+
+@pytest.mark.unit
+class TestDiskMemoization:
+    """Opt-in disk cache around build_universes."""
+
+    def _large_ranks(self):
+        # Above _MEMOIZE_MIN_ROWS (1000) so the cache path engages
+        n = 1200
+        return _mk_ranks(
+            ['20240101'] * n,
+            _stock_ids(n),
+            list(range(1, n + 1)),
+            [1_000_000] * n,
+        )
+
+    def test_disabled_by_default_writes_nothing(self, tmp_path, monkeypatch):
+        monkeypatch.delenv('KRX_UNIVERSE_CACHE_DIR', raising=False)
+        monkeypatch.chdir(tmp_path)
+
+        build_universes(
+            ranks_df=self._large_ranks(),
+            universe_tiers={'univ100': 100},
+        )
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_cache_hit_skips_recompute(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('KRX_UNIVERSE_CACHE_DIR', str(tmp_path))
+        ranks_df = self._large_ranks()
+
+        first = build_universes(ranks_df=ranks_df, universe_tiers={'univ100': 100})
+        cache_files = list(tmp_path.glob('*.parquet'))
+        assert len(cache_files) == 1
+
+        # Second call must come from the cache, not the kernel
+        monkeypatch.setattr(
+            universe_builder,
+            '_build_universes_arrays',
+            lambda *a, **kw: pytest.fail('cache miss: kernel re-invoked'),
+        )
+        second = build_universes(ranks_df=ranks_df, universe_tiers={'univ100': 100})
+
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_corrupt_cache_entry_recomputed(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('KRX_UNIVERSE_CACHE_DIR', str(tmp_path))
+        ranks_df = self._large_ranks()
+
+        first = build_universes(ranks_df=ranks_df, universe_tiers={'univ100': 100})
+        cache_file, = tmp_path.glob('*.parquet')
+        cache_file.write_bytes(b'not a parquet file')
+
+        second = build_universes(ranks_df=ranks_df, universe_tiers={'univ100': 100})
+
+        pd.testing.assert_frame_equal(first, second)
+
+@pytest.mark.unit
+@pytest.mark.skipif(universe_builder.pl is None, reason="polars not installed")
+class TestBuildUniversesPolars:
+    """Real polars branch (the pl-is-None fallback is covered elsewhere)."""
+
+    def test_matches_arrow_builder(self, ranks_mixed):
+        tiers = {'univ100': 100, 'univ200': 200}
+
+        result = universe_builder.build_universes_polars(ranks_mixed, tiers)
+        expected = build_universes_arrow(ranks_mixed, tiers)
+
+        assert result.replace_schema_metadata(None).equals(
+            expected.replace_schema_metadata(None)
+        )
+
+    def test_null_ranks_excluded(self):
+        ranks_df = pd.DataFrame({
+            'TRD_DD': ['20240101', '20240101'],
+            'ISU_SRT_CD': ['STOCK01', 'STOCK02'],
+            'liquidity_rank': [1.0, np.nan],
+            'ACC_TRDVAL': [1_000_000, 900_000],
+        })
+
+        result = universe_builder.build_universes_polars(
+            ranks_df, {'univ100': 100}
+        )
+
+        assert result.column('ISU_SRT_CD').to_pylist() == ['STOCK01']
+
+@pytest.mark.unit
+@pytest.mark.skipif(
+    universe_builder._fill_flags is None, reason="numba not installed"
+)
+class TestFillFlagsNumba:
+    """JIT flags kernel must agree with the searchsorted NumPy path."""
+
+    def test_matches_numpy_kernel(self, monkeypatch):
+        dates = np.full(5, '20240101')
+        symbols = _stock_ids(5)
+        # Ranks straddling the thresholds, including one beyond every tier;
+        # univ500/univ1000 omitted so the missing-tier (-1) branch is hit
+        ranks = np.array([50, 150, 300, 600, 1500])
+        tiers = {'univ100': 100, 'univ200': 200}
+
+        jit_arr = universe_builder._build_universes_arrays(
+            dates, symbols, ranks, tiers
+        )
+        monkeypatch.setattr(universe_builder, '_fill_flags', None)
+        numpy_arr = universe_builder._build_universes_arrays(
+            dates, symbols, ranks, tiers
+        )
+
+        assert np.array_equal(jit_arr, numpy_arr)
@@ -2,77 +2,173 @@ from __future__ import annotations
 
 import argparse
 import ast
+import hashlib
+import io
+import mmap
 import os
+import pickle
+import sys
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import yaml
 
+try:  # libyaml bindings: 5-10x faster parse/emit, identical output
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
+
+_AST_CACHE_DIR = Path.home() / ".cache" / "kqdl" / "pykrx-ast"
+
+# Interned enum values: every endpoint spec shares these single tuples
+# instead of allocating fresh lists per endpoint. The dumper serializes
+# them as plain YAML sequences (representer registered below).
+_ENUM_MKTID = ("STK", "KSQ", "KNX", "ALL")
+_ENUM_ADJ = (1, 2)
+
+_SafeDumper.add_representer(tuple, lambda d, v: d.represent_list(list(v)))
+
+# Parameter-classification templates: one dict.get per param instead of an
+# if/elif chain, with a single shared template per known name.
+_PARAM_RULES: Dict[str, Dict[str, Any]] = {
+    "strtDd": {"required": True, "type": "date(yyyymmdd)", "role": "start_date"},
+    "startDd": {"required": True, "type": "date(yyyymmdd)", "role": "start_date"},
+    "endDd": {"required": True, "type": "date(yyyymmdd)", "role": "end_date"},
+    "trdDd": {"required": True, "type": "date(yyyymmdd)"},
+    "mktId": {"required": True, "type": "enum", "enum": _ENUM_MKTID},
+    "adjStkPrc": {"required": True, "type": "enum", "enum": _ENUM_ADJ, "default": 1},
+}
+_DEFAULT_PARAM: Dict[str, Any] = {"required": True, "type": "string"}
+
+
+def _read_bytes(path: str) -> bytes:
+    """Single unbuffered read: the size is known up front, so buffered I/O
+    would only add chunk stitching and an extra copy."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
+
+def _load_ast_cached(path: str, src: bytes) -> ast.Module:
+    """Parse ``src`` (the contents of ``path``), caching the pickled AST.
+
+    Keyed by SHA256 of the source bytes plus the interpreter version, so
+    edits to the source (or a Python upgrade) invalidate automatically.
+    On a hit the tokenize+parse pass is replaced by a single pickle load.
+    """
+    digest = hashlib.sha256(src).hexdigest()
+    ver = f"{sys.version_info.major}.{sys.version_info.minor}"
+    cache_path = _AST_CACHE_DIR / f"{digest}-{ver}.pkl"
+
+    if cache_path.exists():
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except (pickle.UnpicklingError, EOFError, AttributeError):
+            pass  # corrupt/stale cache entry; fall through to re-parse
+
+    tree = ast.parse(src, filename=path)
+    _AST_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, "wb") as f:
+        pickle.dump(tree, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return tree
+
+
+def _has_base(node: ast.ClassDef, wanted: str = "KrxWebIo") -> bool:
+    """Early-exit base check; no intermediate list for the common miss."""
+    for b in node.bases:
+        if isinstance(b, ast.Name):
+            if b.id == wanted:
+                return True
+        elif isinstance(b, ast.Attribute) and b.attr == wanted:
+            return True
+    return False
+
+
+class _BldReturnFinder(ast.NodeVisitor):
+    """Find the first string-constant return; stops traversal on the hit."""
+
+    def __init__(self) -> None:
+        self.value: Optional[str] = None
+
+    def visit_Return(self, node: ast.Return) -> None:
+        if isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+            self.value = node.value.value
+            raise StopIteration
+        self.generic_visit(node)
+
+
+class _RootKeyFinder(ast.NodeVisitor):
+    """Find the first ``result['...']`` subscript naming a known root key."""
+
+    _KNOWN_KEYS = frozenset({"output", "OutBlock_1", "block1"})
+
+    def __init__(self) -> None:
+        self.value: Optional[str] = None
+
+    def visit_Subscript(self, node: ast.Subscript) -> None:
+        if isinstance(node.slice, ast.Index):  # type: ignore[attr-defined]
+            s = node.slice.value  # type: ignore[attr-defined]
+        else:
+            s = getattr(node.slice, "value", None)
+        if isinstance(s, ast.Constant) and isinstance(s.value, str):
+            if s.value in self._KNOWN_KEYS:
+                self.value = s.value
+                raise StopIteration
+        self.generic_visit(node)
+
 
 def parse_core(core_path: str) -> List[Dict[str, Any]]:
-    with open(core_path, "r", encoding="utf-8") as f:
-        tree = ast.parse(f.read(), filename=core_path)
+    src = _read_bytes(core_path)
+    # memchr-speed pre-scan: a source with no KrxWebIo subclasses needs no
+    # tokenizing or AST building at all.
+    if src.find(b"KrxWebIo") == -1:
+        return []
+    tree = _load_ast_cached(core_path, src)
 
     endpoints: List[Dict[str, Any]] = []
 
     class EndpointVisitor(ast.NodeVisitor):
         def visit_ClassDef(self, node: ast.ClassDef) -> None:
-            bases = [getattr(b, "id", None) or getattr(getattr(b, "attr", None), "id", None) for b in node.bases]
-            if "KrxWebIo" not in bases:
+            if not _has_base(node):
                 return
 
             bld_value: Optional[str] = None
             fetch_func: Optional[ast.FunctionDef] = None
             root_key: Optional[str] = None
 
+            # Single pass over the class body; the targeted finders stop at
+            # the first hit instead of walking every nested expression.
             for body_item in node.body:
-                if isinstance(body_item, ast.FunctionDef) and body_item.name == "bld":
-                    # find return string constant
-                    for stmt in ast.walk(body_item):
-                        if isinstance(stmt, ast.Return):
-                            if isinstance(stmt.value, ast.Constant) and isinstance(stmt.value.value, str):
-                                bld_value = stmt.value.value
-                                break
-                if isinstance(body_item, ast.FunctionDef) and body_item.name == "fetch":
+                if not isinstance(body_item, ast.FunctionDef):
+                    continue
+                if body_item.name == "bld":
+                    finder = _BldReturnFinder()
+                    try:
+                        finder.visit(body_item)
+                    except StopIteration:
+                        pass
+                    bld_value = finder.value
+                elif body_item.name == "fetch":
                     fetch_func = body_item
-                    # try to get root key from return
-                    for stmt in ast.walk(body_item):
-                        if isinstance(stmt, ast.Subscript):
-                            # look for result['...']
-                            if isinstance(stmt.slice, ast.Index):  # type: ignore[attr-defined]
-                                s = stmt.slice.value
-                            else:
-                                s = getattr(stmt.slice, "value", None)
-                            if isinstance(s, ast.Constant) and isinstance(s.value, str):
-                                if s.value in {"output", "OutBlock_1", "block1"}:
-                                    root_key = s.value
-                                    break
+                    key_finder = _RootKeyFinder()
+                    try:
+                        key_finder.visit(body_item)
+                    except StopIteration:
+                        pass
+                    root_key = key_finder.value
 
             if not bld_value or not fetch_func:
                 return
 
             # Params from fetch signature (exclude self)
             params = [a.arg for a in fetch_func.args.args if a.arg != "self"]
-            params_map: Dict[str, Any] = {}
-            for p in params:
-                entry: Dict[str, Any] = {"required": True}
-                if p in {"strtDd", "startDd"}:
-                    entry["type"] = "date(yyyymmdd)"
-                    entry["role"] = "start_date"
-                elif p in {"endDd"}:
-                    entry["type"] = "date(yyyymmdd)"
-                    entry["role"] = "end_date"
-                elif p in {"trdDd"}:
-                    entry["type"] = "date(yyyymmdd)"
-                elif p in {"mktId"}:
-                    entry["type"] = "enum"
-                    entry["enum"] = ["STK", "KSQ", "KNX", "ALL"]
-                elif p in {"adjStkPrc"}:
-                    entry["type"] = "enum"
-                    entry["enum"] = [1, 2]
-                    entry["default"] = 1
-                else:
-                    entry["type"] = "string"
-                params_map[p] = entry
+            params_map: Dict[str, Any] = {
+                p: dict(_PARAM_RULES.get(p, _DEFAULT_PARAM)) for p in params
+            }
 
             client_policy: Dict[str, Any] = {}
             if "strtDd" in params_map and "endDd" in params_map:
@@ -106,12 +202,22 @@ def parse_core(core_path: str) -> List[Dict[str, Any]]:
 
 
 def merge_into_yaml(target_yaml: str, endpoints: List[Dict[str, Any]]) -> None:
-    with open(target_yaml, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+    # mmap gives the parser a zero-copy view of the file instead of
+    # pulling it through the text layer in small chunks.
+    with open(target_yaml, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            data = {}  # cannot mmap an empty file
+        else:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                data = yaml.load(mm, Loader=_SafeLoader) or {}
+            finally:
+                mm.close()
     if "endpoints" not in data:
         data["endpoints"] = {}
 
     existing_keys = set(data["endpoints"].keys())
+    changed = False
     for ep in endpoints:
         ep_id = ep.pop("id")
         if ep_id in existing_keys:
@@ -120,9 +226,15 @@ def merge_into_yaml(target_yaml: str, endpoints: List[Dict[str, Any]]) -> None:
         if ep.get("client_policy") is None:
             ep.pop("client_policy", None)
         data["endpoints"][ep_id] = ep
+        changed = True
+
+    if not changed:
+        return  # every endpoint already present; skip the emit + rewrite
 
-    with open(target_yaml, "w", encoding="utf-8") as f:
-        yaml.safe_dump(data, f, sort_keys=False, allow_unicode=True)
+    # 1 MiB BufferedWriter coalesces the emitter's token-sized writes
+    # into a handful of syscalls.
+    with open(target_yaml, "wb", buffering=0) as raw, io.BufferedWriter(raw, buffer_size=1 << 20) as f:
+        yaml.dump(data, f, Dumper=_SafeDumper, sort_keys=False, allow_unicode=True, encoding="utf-8")
 
 
 def main() -> None:
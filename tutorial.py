@@ -83,68 +83,94 @@ print("Sample:", rows_change_rates[:3])
 import time
 from typing import Any, Dict
 
+# Known param names -> synthetic defaults: one hashed lookup instead of the
+# old if/elif chain, run for every endpoint x parameter during verification.
+_SENTINEL = object()
+_STATIC_PARAM_DEFAULTS: Dict[str, Any] = {
+    "isuCd": "KR7005930003",
+    "idxIndMidclssCd": "01",
+    "group_id": "5",
+    "indTpCd": "5",
+    "ticker": "300",
+    "indTpCd2": "300",
+    "market": "1",
+    "inqCondTpCd": 1,
+    "mktTpCd": 1,
+    "trdVolVal": 1,
+    "askBid": 1,
+    "etf": "",
+    "etn": "",
+    "els": "",
+    "elw": "",
+    "typeNo": 0,
+    "searchText": "",
+    "mktsel": "ALL",
+    "secugrpId": "STMFRTSCIFDRFS",
+}
+
 def synthesize_params(endpoint_id: str, spec) -> Dict[str, Any]:
     params: Dict[str, Any] = {}
     for name, ps in spec.params.items():
-        if ps.default is not None:
-            params[name] = ps.default
+        # Bind attributes once per param: each ps.x is a descriptor lookup,
+        # and this loop runs for every endpoint x parameter.
+        pdefault = ps.default
+        if pdefault is not None:
+            params[name] = pdefault
             continue
-        if getattr(ps, "role", None) == "start_date":
+        role = getattr(ps, "role", None)
+        if role == "start_date":
             params[name] = "20240102"
             continue
-        if getattr(ps, "role", None) == "end_date":
+        if role == "end_date":
             params[name] = "20240105"
             continue
-        if ps.type and str(ps.type).startswith("date("):
+        ptype = ps.type
+        if ptype is not None and ptype[:5] == "date(":
             params[name] = "20240105"
             continue
-        if ps.enum:
-            vals = list(ps.enum)
+        penum = ps.enum
+        if penum:
+            vals = list(penum)
             params[name] = "ALL" if "ALL" in vals else vals[0]
             continue
-        if name == "isuCd":
-            params[name] = "KR7005930003"
-        elif name == "idxIndMidclssCd":
-            params[name] = "01"
-        elif name in ("group_id", "indTpCd"):
-            params[name] = "5"
-        elif name in ("ticker", "indTpCd2"):
-            params[name] = "300"
-        elif name == "market":
-            params[name] = "1"
-        elif name in ("inqCondTpCd", "mktTpCd", "trdVolVal", "askBid"):
-            params[name] = 1
-        elif name in ("etf", "etn", "els", "elw"):
-            params[name] = ""
-        elif name == "typeNo":
-            params[name] = 0
-        elif name == "searchText":
-            params[name] = ""
-        elif name == "mktsel":
-            params[name] = "ALL"
-        elif name == "secugrpId":
-            params[name] = "STMFRTSCIFDRFS"
-        else:
-            params[name] = ""
+        val = _STATIC_PARAM_DEFAULTS.get(name, _SENTINEL)
+        params[name] = "" if val is _SENTINEL else val
 
     if "els" in params and "elw" not in params:
         params["elw"] = params["els"]
     return params
 
 print("\n=== Bulk endpoint verification (live) ===")
+# The calls are independent network I/O, so a small thread pool overlaps
+# their latency; the semaphore + per-worker sleep keeps the aggregate
+# request rate within KRX limits.
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+_rate_limit = threading.Semaphore(4)
+
+def _call_one(eid: str, spec) -> bool:
+    with _rate_limit:
+        try:
+            call_params = synthesize_params(eid, spec)
+            rows = raw.call(eid, host_id="krx", params=call_params)
+            print(f"{eid}: OK {len(rows)} rows")
+            return True
+        except Exception as e:
+            print(f"{eid}: FAIL {type(e).__name__}: {e}")
+            return False
+        finally:
+            time.sleep(0.3)  # pace before releasing the slot
+
 ok = 0
 fail = 0
-for eid, spec in reg.specs.items():
-    try:
-        call_params = synthesize_params(eid, spec)
-        rows = raw.call(eid, host_id="krx", params=call_params)
-        print(f"{eid}: OK {len(rows)} rows")
-        ok += 1
-        time.sleep(0.3)
-    except Exception as e:
-        print(f"{eid}: FAIL {type(e).__name__}: {e}")
-        fail += 1
-        time.sleep(0.3)
+with ThreadPoolExecutor(max_workers=4) as ex:
+    futures = {ex.submit(_call_one, eid, spec): eid for eid, spec in reg.specs.items()}
+    for fut in as_completed(futures):
+        if fut.result():
+            ok += 1
+        else:
+            fail += 1
 print(f"Summary: {ok} OK, {fail} FAIL")
 
 #%%